@@ -1,7 +1,80 @@
 # ai_scheduler.py
+# Picks a scheduling algorithm for a workload without running them all. A
+# small decision tree, trained offline by train_ai_scheduler.py on simulated
+# workloads labelled by the schedulers themselves, maps a handful of
+# workload features to the algorithm expected to do best. The tree is kept
+# as JSON next to this file and loaded once; if it is missing or out of
+# date, a fixed heuristic is used instead.
+import json
+import math
+import os
+from functools import lru_cache
+from process_table import ProcessTable
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ai_scheduler_model.json")
+MODEL_VERSION = 1
+FEATURES = ["log_count", "log_burst_mean", "burst_cv", "arrival_rate", "load",
+            "priority_spread", "priority_burst_corr", "quantum_ratio"]
+
+def workload_features(processes, quantum=2):
+    # One pass over the arrival, burst and priority columns.
+    if isinstance(processes, ProcessTable):
+        arrival, burst, priority = processes.arrival, processes.burst, processes.priority
+    else:
+        arrival = [p.arrival_time for p in processes]
+        burst = [p.burst_time for p in processes]
+        priority = [p.priority for p in processes]
+    n = len(burst)
+    burst_mean = math.fsum(burst) / n
+    priority_mean = math.fsum(priority) / n
+    burst_var = max(math.fsum(b * b for b in burst) / n - burst_mean ** 2, 0.0)
+    priority_var = max(math.fsum(p * p for p in priority) / n - priority_mean ** 2, 0.0)
+    covariance = math.fsum(b * p for b, p in zip(burst, priority)) / n - burst_mean * priority_mean
+    span = max(arrival) - min(arrival) + 1
+    return [
+        math.log10(n),
+        math.log10(max(burst_mean, 1)),
+        math.sqrt(burst_var) / burst_mean if burst_mean else 0.0,
+        n / span,
+        n * burst_mean / span,
+        math.sqrt(priority_var),
+        covariance / math.sqrt(burst_var * priority_var) if burst_var and priority_var else 0.0,
+        quantum / burst_mean if burst_mean else 0.0,
+    ]
+
+def heuristic_choice(features):
+    # Used when no trained model is available.
+    _, log_burst_mean, *_ = features
+    return "SJF-P" if log_burst_mean <= math.log10(5) else "RR"
+
+@lru_cache(maxsize=None)
+def load_model(path=MODEL_PATH):
+    try:
+        with open(path, "r") as f:
+            model = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if model.get("version") != MODEL_VERSION or model.get("features") != FEATURES:
+        return None
+    return model
+
+def predict(tree, features):
+    # Inner nodes are [feature index, threshold, left, right]; leaves are
+    # algorithm names.
+    node = tree
+    while not isinstance(node, str):
+        index, threshold, left, right = node
+        node = left if features[index] <= threshold else right
+    return node
+
 class AIScheduler:
-    def predict_best_algorithm(self, processes):
+    def __init__(self, model_path=MODEL_PATH):
+        self.model = load_model(model_path)
+
+    def predict_best_algorithm(self, processes, quantum=2):
         if not processes:
             return "FCFS"
-        avg_burst = sum(p.burst_time for p in processes) / len(processes)
-        return "SJF-P" if avg_burst <= 5 else "RR"
\ No newline at end of file
+        features = workload_features(processes, quantum)
+        if self.model is None:
+            return heuristic_choice(features)
+        return predict(self.model["tree"], features)
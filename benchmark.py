@@ -0,0 +1,160 @@
+# benchmark.py
+# Times the schedulers themselves. Every algorithm is run through
+# run_algorithm (so through multi_core_scheduler) at each core count, on
+# generated workloads of each size, recording the best wall time over a few
+# repeats, the peak memory of one extra run under tracemalloc, and timeline
+# segments produced per second. Results go to JSON; pass --baseline to flag
+# cases that got slower or hungrier than an earlier run.
+#
+#   python benchmark.py -o before.json
+#   python benchmark.py -o after.json --baseline before.json
+#   python benchmark.py --compare before.json after.json
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from cpu_scheduler_algorithms import COMPARISON_ALGORITHMS, run_algorithm
+from workload_generator import WorkloadGenerator
+
+DEFAULT_SIZES = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+DEFAULT_CORES = [1, 4, 16]
+MIN_TIME = 0.2    # repeat quick cases until they have run this long
+MAX_TIME = 10.0   # and stop repeating slow ones once they have
+
+def case_key(row):
+    return row["algorithm"], row["cores"], row["processes"]
+
+def run_case(table, algo, quantum, num_cores, repeats=3, memory=True):
+    best = float("inf")
+    runs = elapsed = 0
+    while runs < 1000 and (elapsed < MIN_TIME or (runs < repeats and elapsed < MAX_TIME)):
+        workload = table.copy()
+        gc.collect()
+        start = time.perf_counter()
+        _, _, timeline = run_algorithm(algo, workload, quantum, num_cores, cache=None)
+        took = time.perf_counter() - start
+        best = min(best, took)
+        elapsed += took
+        runs += 1
+        del workload
+    peak = None
+    if memory:
+        workload = table.copy()
+        gc.collect()
+        tracemalloc.start()
+        run_algorithm(algo, workload, quantum, num_cores, cache=None)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {
+        "algorithm": algo,
+        "cores": num_cores,
+        "processes": len(table),
+        "seconds": best,
+        "repeats": runs,
+        "peak_bytes": peak,
+        "segments": len(timeline),
+        "segments_per_second": len(timeline) / best if best > 0 else None
+    }
+
+def run_benchmarks(sizes, algorithms, cores, quantum=2, seed=0, repeats=3, memory=True, log=None):
+    rows = []
+    for size in sizes:
+        table = WorkloadGenerator(seed).table(size)
+        for algo in algorithms:
+            for num_cores in cores:
+                row = run_case(table, algo, quantum, num_cores, repeats, memory)
+                rows.append(row)
+                if log:
+                    log(row)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "seed": seed,
+            "quantum": quantum
+        },
+        "results": rows
+    }
+
+def compare(baseline, current, threshold=0.1):
+    # (row, field, old, new) for every shared case whose time or peak memory
+    # grew by more than threshold. Cases under a millisecond are too noisy
+    # to judge on time.
+    old_rows = {case_key(row): row for row in baseline["results"]}
+    regressions = []
+    for row in current["results"]:
+        old = old_rows.get(case_key(row))
+        if old is None:
+            continue
+        if max(row["seconds"], old["seconds"]) >= 1e-3 and row["seconds"] > old["seconds"] * (1 + threshold):
+            regressions.append((row, "seconds", old["seconds"], row["seconds"]))
+        if old.get("peak_bytes") and row.get("peak_bytes") and row["peak_bytes"] > old["peak_bytes"] * (1 + threshold):
+            regressions.append((row, "peak_bytes", old["peak_bytes"], row["peak_bytes"]))
+    return regressions
+
+def format_row(row):
+    peak = f"{row['peak_bytes'] / 2**20:9.1f} MiB" if row.get("peak_bytes") is not None else "        - MiB"
+    rate = f"{row['segments_per_second']:12,.0f} segments/s" if row.get("segments_per_second") else "           - segments/s"
+    return (f"{row['algorithm']:>12} {row['cores']:>3} cores {row['processes']:>9,} procs "
+            f"{row['seconds'] * 1e3:11.2f} ms {peak} {rate}")
+
+def report_regressions(regressions, threshold):
+    if not regressions:
+        print(f"No regressions beyond {threshold:.0%}.", file=sys.stderr)
+        return 0
+    print(f"{len(regressions)} regression(s) beyond {threshold:.0%}:", file=sys.stderr)
+    for row, field, old, new in regressions:
+        print(f"  {row['algorithm']} {row['cores']} cores {row['processes']:,} procs: "
+              f"{field} {old:.6g} -> {new:.6g} ({new / old - 1:+.0%})", file=sys.stderr)
+    return 1
+
+def load_results(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the schedulers across workload sizes and core counts.")
+    parser.add_argument("-n", "--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="workload sizes (default: 10 to 1000000 by powers of 10)")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=COMPARISON_ALGORITHMS,
+                        choices=COMPARISON_ALGORITHMS, metavar="ALGO", help="algorithms (default: all)")
+    parser.add_argument("-c", "--cores", nargs="+", type=int, default=DEFAULT_CORES, help="core counts (default: 1 4 16)")
+    parser.add_argument("-q", "--quantum", type=int, default=2, help="time quantum (default: 2)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="workload seed (default: 0)")
+    parser.add_argument("-r", "--repeats", type=int, default=3, help="timed runs per case, best kept (default: 3)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("-o", "--output", help="write results to this JSON file (default: stdout)")
+    parser.add_argument("--baseline", help="earlier results to check this run against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown/growth (default: 0.1 = 10%%)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two saved runs without benchmarking")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.compare:
+        return report_regressions(compare(*map(load_results, args.compare), args.threshold), args.threshold)
+    if any(n <= 0 for n in args.sizes) or any(c <= 0 for c in args.cores) or args.quantum <= 0:
+        print("Error: sizes, cores and quantum must be > 0", file=sys.stderr)
+        return 2
+    baseline = load_results(args.baseline) if args.baseline else None
+    results = run_benchmarks(args.sizes, args.algorithms, args.cores, args.quantum, args.seed, args.repeats,
+                             not args.no_memory, log=lambda row: print(format_row(row), file=sys.stderr))
+    text = json.dumps(results, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    if baseline:
+        return report_regressions(compare(baseline, results, args.threshold), args.threshold)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
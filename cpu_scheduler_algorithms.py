@@ -1,7 +1,18 @@
+import heapq
+import math
 import random
-from copy import deepcopy
+from collections import deque
+from operator import attrgetter, le
+from process_table import NOT_SET, ProcessTable, clone_processes
+from timeline_store import Timeline
+from result_cache import RESULT_CACHE, cache_key, workload_fingerprint
+from ai_scheduler import AIScheduler
+from instrumentation import INSTRUMENTATION
 
 class Process:
+    __slots__ = ("pid", "arrival_time", "burst_time", "priority", "original_priority", "remaining_time",
+                 "start_time", "end_time", "waiting_time", "turnaround_time", "last_scheduled")
+
     def __init__(self, pid, arrival_time, burst_time, priority):
         self.pid = pid
         self.arrival_time = arrival_time
@@ -15,298 +26,894 @@ class Process:
         self.turnaround_time = 0
         self.last_scheduled = 0
 
+def _metric_columns(processes):
+    # A finished ProcessTable, or a list of views covering one, is summarised
+    # straight from its columns; anything else is gathered into columns in
+    # one pass.
+    if isinstance(processes, ProcessTable):
+        if min(processes.start) != NOT_SET and min(processes.end) != NOT_SET:
+            return processes.arrival, processes.burst, processes.start, processes.end, processes.waiting, processes.turnaround
+        processes = processes.views()
+    table = getattr(processes[0], "table", None)
+    if isinstance(table, ProcessTable) and len(table) == len(processes):
+        try:
+            same_table = set(map(attrgetter("table"), processes)) == {table}
+        except AttributeError:
+            same_table = False
+        if same_table and min(table.start) != NOT_SET and min(table.end) != NOT_SET:
+            return table.arrival, table.burst, table.start, table.end, table.waiting, table.turnaround
+    arrival, burst, start, end, waiting, turnaround = [], [], [], [], [], []
+    for p in processes:
+        arrival.append(p.arrival_time)
+        burst.append(p.burst_time)
+        start.append(p.start_time)
+        end.append(p.end_time)
+        waiting.append(p.waiting_time)
+        turnaround.append(p.turnaround_time)
+    return arrival, burst, start, end, waiting, turnaround
+
+def _percentile(sorted_values, q):
+    # Nearest-rank percentile of an already sorted sequence.
+    return sorted_values[max(0, math.ceil(q / 100 * len(sorted_values)) - 1)]
+
 def calculate_metrics(processes):
     if not processes:
         return 0, 0, 0, 0
-    total_wait = sum(p.waiting_time for p in processes)
-    total_turn = sum(p.turnaround_time for p in processes)
-    total_burst = sum(p.burst_time for p in processes)
-    end_time = max(p.end_time for p in processes if p.end_time is not None)
-    avg_wait = total_wait / len(processes)
-    avg_turn = total_turn / len(processes)
-    cpu_util = (total_burst / end_time) * 100 if end_time > 0 else 0
+    _, burst, _, end, waiting, turnaround = _metric_columns(processes)
+    end_time = max(e for e in end if e is not None) if isinstance(end, list) and None in end else max(end)
+    avg_wait = sum(waiting) / len(processes)
+    avg_turn = sum(turnaround) / len(processes)
+    cpu_util = (sum(burst) / end_time) * 100 if end_time > 0 else 0
     throughput = len(processes) / end_time if end_time > 0 else 0
     return avg_wait, avg_turn, cpu_util, throughput
 
-def priority_boost(processes, current_time, boost_interval=10):
-    for p in processes:
-        if current_time - p.last_scheduled > boost_interval and p.remaining_time > 0:
-            p.priority = max(0, p.priority - 1)
-            p.last_scheduled = current_time
+def calculate_extended_metrics(processes):
+    # The four classic averages plus tail latency (nearest-rank p50/p90/p99
+    # and max), response time (start - arrival), slowdown (turnaround / burst)
+    # and Jain's fairness index over each process's share of the CPU while
+    # it was in the system (burst / turnaround).
+    avg_wait, avg_turn, cpu_util, throughput = calculate_metrics(processes)
+    metrics = {"avg_wait": avg_wait, "avg_turn": avg_turn, "cpu_util": cpu_util, "throughput": throughput}
+    if not processes:
+        for name in ("wait", "turn"):
+            metrics.update({f"p50_{name}": 0, f"p90_{name}": 0, f"p99_{name}": 0, f"max_{name}": 0})
+        metrics.update({"avg_response": 0, "p99_response": 0, "max_response": 0,
+                        "avg_slowdown": 0, "max_slowdown": 0, "fairness": 0})
+        return metrics
+    arrival, burst, start, _, waiting, turnaround = _metric_columns(processes)
+    for name, column in (("wait", waiting), ("turn", turnaround)):
+        ordered = sorted(column)
+        metrics[f"p50_{name}"] = _percentile(ordered, 50)
+        metrics[f"p90_{name}"] = _percentile(ordered, 90)
+        metrics[f"p99_{name}"] = _percentile(ordered, 99)
+        metrics[f"max_{name}"] = ordered[-1]
+    response = sorted(s - a for s, a in zip(start, arrival) if s is not None)
+    metrics["avg_response"] = sum(response) / len(response) if response else 0
+    metrics["p99_response"] = _percentile(response, 99) if response else 0
+    metrics["max_response"] = response[-1] if response else 0
+    slowdown = [t / b for t, b in zip(turnaround, burst) if b > 0]
+    share = [b / t for t, b in zip(turnaround, burst) if t > 0]
+    metrics["avg_slowdown"] = sum(slowdown) / len(slowdown) if slowdown else 0
+    metrics["max_slowdown"] = max(slowdown) if slowdown else 0
+    squares = sum(x * x for x in share)
+    metrics["fairness"] = sum(share) ** 2 / (len(share) * squares) if squares else 0
+    return metrics
+
+class SchedulingPolicy:
+    # Pick-next policy for the multi-core engine. The ready process with the
+    # lowest rank runs next, ties going to whichever was queued first; a
+    # preempted process keeps its place in that order, as in the
+    # single-core schedulers.
+    name = "FCFS"
+    preemptive = False
+
+    def __init__(self):
+        self.ready = []
+        self.seq = 0
+        self.seqs = {}
+
+    def __len__(self):
+        return len(self.ready)
+
+    def rank(self, process):
+        return process.arrival_time
+
+    def push(self, process, current_time):
+        seq = self.seqs.pop(process, None)
+        if seq is None:
+            seq = self.seq
+            self.seq += 1
+        heapq.heappush(self.ready, (self.rank(process), seq, process))
+
+    def pop(self, current_time):
+        _, seq, process = heapq.heappop(self.ready)
+        self.seqs[process] = seq
+        return process
+
+    def running_rank(self, running, current_time):
+        # The rank a running process defends its core with; the engine
+        # preempts the core whose process has the highest.
+        return self.rank(running)
+
+    def should_preempt(self, running, current_time):
+        return self.preemptive and bool(self.ready) and self.ready[0][0] < self.rank(running)
+
+    def preemption_time(self, running, current_time):
+        # For policies whose order changes with time alone: when
+        # should_preempt(running, ...) may next become true with no arrival
+        # or slice end in between, or None.
+        return None
+
+    def time_slice(self, process):
+        return process.remaining_time
+
+    def on_slice_end(self, process, current_time):
+        pass
+
+    def on_finish(self, process, current_time):
+        # Whatever was kept about a running process can go.
+        self.seqs.pop(process, None)
+
+class SJFPolicy(SchedulingPolicy):
+    def __init__(self, preemptive=False):
+        super().__init__()
+        self.preemptive = preemptive
+        self.name = "SJF (Preemptive)" if preemptive else "SJF (Non-Preemptive)"
+
+    def rank(self, process):
+        return process.remaining_time if self.preemptive else process.burst_time
+
+class PriorityPolicy(SchedulingPolicy):
+    def __init__(self, preemptive=False):
+        super().__init__()
+        self.preemptive = preemptive
+        self.name = "Priority (Preemptive)" if preemptive else "Priority (Non-Preemptive)"
+
+    def rank(self, process):
+        return process.priority
+
+AGING_INTERVAL = 10   # time units a process waits to gain one priority level
+
+def _check_aging(interval):
+    if interval <= 0:
+        raise ValueError(f"Invalid aging interval {interval}: must be > 0")
+
+def _aged_level(key, current_time, interval):
+    # The whole-level effective priority of a process queued with key
+    # priority * interval + queued: priority - (now - queued) // interval.
+    return -((current_time - key) // interval)
+
+def _aging_wakeup(key, level, priority, grace_end, interval):
+    # When the waiting process with this key first gets strictly better
+    # than a running one that holds level until grace_end and its base
+    # priority after that.
+    return min(key - (level - 1) * interval, max(grace_end, key - (priority - 1) * interval))
+
+class AgingPriorityPolicy(SchedulingPolicy):
+    # Priority with aging: a waiting process gains a level for every whole
+    # interval it has waited, i.e. at time t its effective priority is
+    # priority - (t - queued) // interval. That is a non-decreasing function
+    # of priority * interval + queued, so the heap is keyed on that once, on
+    # push, and its top always has the best effective priority: aging costs
+    # nothing beyond the O(log n) push and pop, with no scan of the queue.
+    #
+    # Once dispatched, a process is back at its base priority, except that
+    # for its first interval it holds the level it was dispatched at; only
+    # a strictly better level preempts it. So a process that aged its way
+    # to the CPU gets at least an interval there, and then yields to
+    # anything of higher base priority: switches stay O(work / interval)
+    # and higher priorities keep the larger share. A preempted process is
+    # queued again at its base priority.
+    def __init__(self, preemptive=False, interval=AGING_INTERVAL):
+        _check_aging(interval)
+        super().__init__()
+        self.preemptive = preemptive
+        self.interval = interval
+        self.levels = {}
+        self.name = "Priority Aging (Preemptive)" if preemptive else "Priority Aging (Non-Preemptive)"
+
+    def running_rank(self, running, current_time):
+        level, grace_end = self.levels[running]
+        return level if current_time < grace_end else running.priority
+
+    def push(self, process, current_time):
+        # New arrivals age from their arrival time, however late the engine
+        # gets round to queueing them.
+        queued = process.arrival_time if self.levels.pop(process, None) is None else current_time
+        heapq.heappush(self.ready, (process.priority * self.interval + queued, self.seq, process))
+        self.seq += 1
+
+    def pop(self, current_time):
+        key, _, process = heapq.heappop(self.ready)
+        self.levels[process] = (_aged_level(key, current_time, self.interval), current_time + self.interval)
+        return process
+
+    def should_preempt(self, running, current_time):
+        return (self.preemptive and bool(self.ready)
+                and _aged_level(self.ready[0][0], current_time, self.interval) < self.running_rank(running, current_time))
+
+    def preemption_time(self, running, current_time):
+        if not (self.preemptive and self.ready):
+            return None
+        level, grace_end = self.levels[running]
+        return _aging_wakeup(self.ready[0][0], level, running.priority, grace_end, self.interval)
+
+    def on_finish(self, process, current_time):
+        self.levels.pop(process, None)
+
+class RoundRobinPolicy(SchedulingPolicy):
+    name = "Round Robin"
+
+    def __init__(self, quantum):
+        super().__init__()
+        self.ready = deque()
+        self.quantum = quantum
+
+    def push(self, process, current_time):
+        self.ready.append(process)
 
-def multi_core_scheduler(processes, num_cores, scheduler_func):
+    def pop(self, current_time):
+        return self.ready.popleft()
+
+    def time_slice(self, process):
+        return min(self.quantum, process.remaining_time)
+
+class MLFQueues:
+    # Ready processes of a multi-level feedback queue, one deque per level.
+    # The top level is a deque of deques, so a priority boost splices every
+    # lower level onto it (in level order) in O(levels) instead of moving
+    # the processes one by one. A process's level is the queue it sits in,
+    # so it never touches the process's priority.
+    def __init__(self, levels):
+        self.top = deque([deque()])
+        self.lower = [deque() for _ in range(levels - 1)]
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, process, level):
+        (self.top[-1] if level == 0 else self.lower[level - 1]).append(process)
+        self.size += 1
+
+    def pop(self):
+        # (level, process) from the highest non-empty level.
+        self.size -= 1
+        top = self.top
+        while not top[0] and len(top) > 1:
+            top.popleft()
+        if top[0]:
+            return 0, top[0].popleft()
+        for level, queue in enumerate(self.lower, 1):
+            if queue:
+                return level, queue.popleft()
+        raise IndexError("pop from empty MLFQueues")
+
+    def boost(self):
+        for i, queue in enumerate(self.lower):
+            if queue:
+                self.top.append(queue)
+                self.lower[i] = deque()
+
+def _check_mlfq(quanta, boost_interval):
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError(f"Invalid MLFQ quanta {quanta!r}: need at least one level, all quanta > 0")
+    if boost_interval is not None and boost_interval <= 0:
+        raise ValueError(f"Invalid MLFQ boost interval {boost_interval}: must be > 0")
+
+class MLFQPolicy(SchedulingPolicy):
+    # Boosts happen at the first dispatch at or after each multiple of
+    # boost_interval, as in the single-core engine.
+    name = "MLFQ"
+
+    def __init__(self, quanta, boost_interval=None):
+        _check_mlfq(quanta, boost_interval)
+        super().__init__()
+        self.quanta = quanta
+        self.boost_interval = boost_interval
+        self.next_boost = boost_interval
+        self.queues = MLFQueues(len(quanta))
+        self.levels = {}
+
+    def __len__(self):
+        return len(self.queues)
+
+    def push(self, process, current_time):
+        self.queues.push(process, self.levels.pop(process, 0))
+
+    def pop(self, current_time):
+        if self.next_boost is not None and current_time >= self.next_boost:
+            self.queues.boost()
+            self.next_boost = (current_time // self.boost_interval + 1) * self.boost_interval
+        level, process = self.queues.pop()
+        self.levels[process] = level
+        return process
+
+    def time_slice(self, process):
+        return min(self.quanta[self.levels[process]], process.remaining_time)
+
+    def on_slice_end(self, process, current_time):
+        self.levels[process] = min(self.levels[process] + 1, len(self.quanta) - 1)
+
+    def on_finish(self, process, current_time):
+        self.levels.pop(process, None)
+
+def intelligent_policy(processes, quantum):
+    return _policy_for(_intelligent_choice(processes, quantum), quantum)
+
+def _default_policy(scheduler_func):
+    policies = {
+        fcfs_scheduler: SchedulingPolicy,
+        sjf_non_preemptive: lambda: SJFPolicy(preemptive=False),
+        sjf_preemptive: lambda: SJFPolicy(preemptive=True),
+        priority_non_preemptive: lambda: PriorityPolicy(preemptive=False),
+        priority_preemptive: lambda: PriorityPolicy(preemptive=True),
+        priority_aging_non_preemptive: lambda: AgingPriorityPolicy(preemptive=False),
+        priority_aging_preemptive: lambda: AgingPriorityPolicy(preemptive=True),
+    }
+    if scheduler_func not in policies:
+        raise ValueError(f"No multi-core policy for {getattr(scheduler_func, '__name__', scheduler_func)}, pass one explicitly")
+    return policies[scheduler_func]()
+
+def multi_core_scheduler(processes, num_cores, scheduler_func, policy=None):
     if num_cores == 1:
         return scheduler_func(processes)
-    processes = deepcopy(processes)
+    if policy is None:
+        policy = _default_policy(scheduler_func)
+    processes = clone_processes(processes)
     processes.sort(key=lambda x: x.arrival_time)
-    timelines = [[] for _ in range(num_cores)]
-    current_times = [0] * num_cores
+    events = _smp_events(processes, num_cores, policy)
+    if INSTRUMENTATION.enabled:
+        events = INSTRUMENTATION.observe(events, processes, f"{policy.name} (Multi-Core)")
+    completed, timeline = collect_events(events, num_cores)
+    return completed, f"{policy.name} (Multi-Core)", timeline
+
+def collect_events(events, num_cores=1):
+    # Gathers a stream of (process, start, end, finished, core) events, as
+    # from _smp_events or step_schedule, into the completed processes and
+    # the timeline.
+    timelines = [Timeline() for _ in range(num_cores)]
+    last_process = [None] * num_cores
     completed = []
-    ready_queue = []
-    all_processes = processes.copy()
-    max_iterations = 10000  # Safeguard against infinite loops
-    iteration = 0
-
-    while processes or ready_queue or any(p.remaining_time > 0 for p in all_processes if p not in completed):
-        if iteration > max_iterations:
-            print(f"Warning: Multi-core scheduler exceeded {max_iterations} iterations for {scheduler_func.__name__}, terminating.")
+    for process, start, end, finished, core in events:
+        if end > start:
+            timelines[core].append(process.pid, start, end, core, merge=last_process[core] is process)
+            last_process[core] = process
+        if finished:
+            completed.append(process)
+    return completed, timelines[0] if num_cores == 1 else Timeline.merged(timelines)
+
+def _smp_events(arrivals, num_cores, policy):
+    # One shared event queue of slice ends; each core has its own clock
+    # (the start of its current slice) and a version number so that the
+    # events of preempted slices can be skipped lazily. Yields
+    # (process, start, end, finished, core) as execution is accounted for;
+    # arrivals is an iterable of processes sorted by arrival time.
+    #
+    # While every core is busy under a non-preemptive policy, an arrival
+    # cannot change anything until a slice ends, so it is only queued then,
+    # after the processes whose slices ended. That is the order the
+    # single-core schedulers use (a round robin process goes back ahead of
+    # anything that arrived during its slice), and it saves the engine a
+    # stop at every arrival.
+    arrivals = iter(arrivals)
+    pending = next(arrivals, None)
+    running = [None] * num_cores
+    slice_start = [0] * num_cores
+    version = [0] * num_cores
+    idle_cores = list(range(num_cores))
+    events = []
+    current_time = 0
+    wakeup = None
+
+    def record(core, process, end):
+        start = slice_start[core]
+        process.remaining_time -= end - start
+        slice_start[core] = end
+        return start
+
+    while True:
+        while events and events[0][2] != version[events[0][1]]:
+            heapq.heappop(events)
+        if pending is not None and (idle_cores or policy.preemptive):
+            current_time = pending.arrival_time
+            if events:
+                current_time = min(current_time, events[0][0])
+        elif events:
+            current_time = events[0][0]
+        else:
             break
-        iteration += 1
-        # Add newly arrived processes to ready queue
-        while processes and processes[0].arrival_time <= min(current_times):
-            ready_queue.append(processes.pop(0))
-        priority_boost(ready_queue, min(current_times))
-
-        # Process one job per core if available
-        for core in range(num_cores):
-            if not ready_queue:
-                current_times[core] += 1
-                continue
-            # Use a copy of ready_queue for the scheduler
-            sub_processes = [p for p in ready_queue if p.arrival_time <= current_times[core]]
-            if not sub_processes:
-                current_times[core] += 1
-                continue
-            sub_processes, algo_name, sub_timeline = scheduler_func(sub_processes)
-            if not sub_timeline:
-                current_times[core] += 1
+        if wakeup is not None and wakeup < current_time:
+            current_time = wakeup
+
+        # Slices ending now
+        while events and events[0][0] == current_time:
+            _, core, v = heapq.heappop(events)
+            if v != version[core]:
                 continue
-            pid, start, end = sub_timeline[0]
-            process = next(p for p in ready_queue if p.pid == pid and p in sub_processes)
-            ready_queue.remove(process)
-            if current_times[core] < process.arrival_time:
-                current_times[core] = process.arrival_time
-            start = current_times[core]
-            execute_time = min(process.remaining_time, end - start)
-            process.remaining_time -= execute_time
-            if process.start_time is None:
-                process.start_time = start
-            timelines[core].append((f"{process.pid} (Core {core})", start, start + execute_time))
-            current_times[core] += execute_time
-            process.last_scheduled = current_times[core]
-            if process.remaining_time == 0:
-                process.end_time = current_times[core]
+            process = running[core]
+            running[core] = None
+            start = record(core, process, current_time)
+            heapq.heappush(idle_cores, core)
+            process.last_scheduled = current_time
+            finished = process.remaining_time <= 0
+            if finished:
+                process.end_time = current_time
                 process.turnaround_time = process.end_time - process.arrival_time
                 process.waiting_time = process.turnaround_time - process.burst_time
-                completed.append(process)
+                policy.on_finish(process, current_time)
             else:
-                ready_queue.append(process)
+                policy.on_slice_end(process, current_time)
+                policy.push(process, current_time)
+            yield process, start, current_time, finished, core
 
-    # Merge timelines
-    merged_timeline = []
-    for core, timeline in enumerate(timelines):
-        for entry in timeline:
-            merged_timeline.append(entry)
-    merged_timeline.sort(key=lambda x: x[1])
-    return completed, f"{algo_name} (Multi-Core)", merged_timeline
+        # Add newly arrived processes to the ready queue
+        while pending is not None and pending.arrival_time <= current_time:
+            policy.push(pending, current_time)
+            pending = next(arrivals, None)
 
-def fcfs_scheduler(processes):
-    processes.sort(key=lambda x: x.arrival_time)
-    timeline = []
+        synced = False
+        wakeup = None
+        while True:
+            while idle_cores and len(policy):
+                core = heapq.heappop(idle_cores)
+                process = policy.pop(current_time)
+                if process.start_time is None:
+                    process.start_time = current_time
+                running[core] = process
+                slice_start[core] = current_time
+                version[core] += 1
+                heapq.heappush(events, (current_time + policy.time_slice(process), core, version[core]))
+            if idle_cores or not (policy.preemptive and len(policy)):
+                break
+            if not synced:
+                for core in range(num_cores):
+                    start = record(core, running[core], current_time)
+                    if current_time > start:
+                        yield running[core], start, current_time, False, core
+                synced = True
+            core = max(range(num_cores), key=lambda c: policy.running_rank(running[c], current_time))
+            if not policy.should_preempt(running[core], current_time):
+                # Look again when the policy says a waiting process may have
+                # overtaken this one, even if nothing else happens by then.
+                wakeup = policy.preemption_time(running[core], current_time)
+                break
+            process = running[core]
+            running[core] = None
+            version[core] += 1
+            heapq.heappush(idle_cores, core)
+            policy.push(process, current_time)
+
+# The single-core schedulers are written as event generators over an
+# arrival-ordered iterable of processes. Each yields (process, start, end,
+# finished) per dispatch, so a workload can be fed in lazily and the results
+# consumed as they are produced; the public functions below just sort the
+# list and collect the events.
+
+def _complete(process, current_time):
+    process.end_time = current_time
+    process.turnaround_time = process.end_time - process.arrival_time
+    process.waiting_time = process.turnaround_time - process.burst_time
+
+def _collect(events, algo_name, processes):
+    if INSTRUMENTATION.enabled:
+        events = INSTRUMENTATION.observe(events, processes, algo_name)
+    timeline = Timeline()
+    completed = []
+    last_process = None
+    for process, start, end, finished in events:
+        # Only slices of the same process are merged, not of two processes
+        # that happen to share a PID.
+        timeline.append(process.pid, start, end, merge=last_process is process)
+        last_process = process
+        if finished:
+            completed.append(process)
+    return completed, algo_name, timeline
+
+def _fcfs_events(arrivals):
     current_time = 0
-    for p in processes:
+    for p in arrivals:
         if current_time < p.arrival_time:
             current_time = p.arrival_time
         p.start_time = current_time
-        timeline.append((p.pid, current_time, current_time + p.burst_time))
         current_time += p.burst_time
-        p.end_time = current_time
-        p.turnaround_time = p.end_time - p.arrival_time
-        p.waiting_time = p.turnaround_time - p.burst_time
-    return processes, "FCFS", timeline
+        _complete(p, current_time)
+        yield p, p.start_time, current_time, True
 
-def sjf_non_preemptive(processes):
-    processes.sort(key=lambda x: x.arrival_time)
-    timeline = []
+def _non_preemptive_events(arrivals, rank):
+    # Arrivals feed a heap keyed on (rank, arrival order), which gives the
+    # same tie-breaking as a stable sort of the arrived processes; idle gaps
+    # jump to the next arrival.
+    arrivals = iter(arrivals)
+    pending = next(arrivals, None)
     current_time = 0
-    completed = []
-    while processes or any(p.arrival_time <= current_time for p in processes):
-        available = [p for p in processes if p.arrival_time <= current_time]
-        if not available:
-            current_time += 1
-            continue
-        available.sort(key=lambda x: x.burst_time)
-        p = available[0]
-        processes.remove(p)
+    ready = []
+    seq = 0
+    while pending is not None or ready:
+        if not ready:
+            current_time = max(current_time, pending.arrival_time)
+        while pending is not None and pending.arrival_time <= current_time:
+            heapq.heappush(ready, (rank(pending), seq, pending))
+            seq += 1
+            pending = next(arrivals, None)
+        p = heapq.heappop(ready)[2]
         p.start_time = current_time
-        timeline.append((p.pid, current_time, current_time + p.burst_time))
         current_time += p.burst_time
-        p.end_time = current_time
-        p.turnaround_time = p.end_time - p.arrival_time
-        p.waiting_time = p.turnaround_time - p.burst_time
-        completed.append(p)
-    return completed, "SJF (Non-Preemptive)", timeline
+        _complete(p, current_time)
+        yield p, p.start_time, current_time, True
 
-def sjf_preemptive(processes):
-    processes.sort(key=lambda x: x.arrival_time)
-    timeline = []
+def _preemptive_events(arrivals, rank):
+    # Event-driven: the clock jumps straight to the next arrival or completion
+    # instead of ticking, and the ready heap is ordered by rank() with ties
+    # going to the earlier arrival.
+    arrivals = iter(arrivals)
+    pending = next(arrivals, None)
     current_time = 0
-    completed = []
+    ready = []
+    seq = 0
+    current_process = None
+    current_seq = None
+    while pending is not None or ready or current_process:
+        if current_process is None and not ready:
+            current_time = max(current_time, pending.arrival_time)
+        while pending is not None and pending.arrival_time <= current_time:
+            heapq.heappush(ready, (rank(pending), seq, pending))
+            seq += 1
+            pending = next(arrivals, None)
+        if current_process is None:
+            _, current_seq, current_process = heapq.heappop(ready)
+        elif ready and ready[0][0] < rank(current_process):
+            heapq.heappush(ready, (rank(current_process), current_seq, current_process))
+            _, current_seq, current_process = heapq.heappop(ready)
+        if current_process.start_time is None:
+            current_process.start_time = current_time
+        start = current_time
+        current_time += current_process.remaining_time
+        if pending is not None:
+            current_time = min(current_time, pending.arrival_time)
+        current_process.remaining_time -= current_time - start
+        finished = current_process.remaining_time <= 0
+        if finished:
+            _complete(current_process, current_time)
+        yield current_process, start, current_time, finished
+        if finished:
+            current_process = None
+
+def _aging_events(arrivals, interval):
+    # Preemptive priority with aging, as in AgingPriorityPolicy: processes
+    # are keyed on priority * interval + the time they were queued (their
+    # arrival, or when they were preempted), and the running one holds the
+    # level it was dispatched at for an interval, then its base priority.
+    # Besides arrivals and completions, a slice ends when the best waiting
+    # process gets strictly better than that.
+    _check_aging(interval)
+    arrivals = iter(arrivals)
+    pending = next(arrivals, None)
+    current_time = 0
+    ready = []
+    seq = 0
     current_process = None
-    while processes or current_process:
-        available = [p for p in processes if p.arrival_time <= current_time]
-        if available:
-            available.sort(key=lambda x: x.remaining_time)
-            if current_process and current_process in processes:
-                available.append(current_process)
-            current_process = min(available, key=lambda x: x.remaining_time)
-            if current_process in processes:
-                processes.remove(current_process)
-        if current_process and current_process not in completed:
-            if current_process.start_time is None:
-                current_process.start_time = current_time
-            execute_time = 1  # Preemptive step by step
-            timeline.append((current_process.pid, current_time, current_time + execute_time))
-            current_process.remaining_time -= execute_time
-            current_time += execute_time
-            if current_process.remaining_time <= 0:
-                current_process.end_time = current_time
-                current_process.turnaround_time = current_process.end_time - current_process.arrival_time
-                current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
-                completed.append(current_process)
+    level = grace_end = 0
+    while pending is not None or ready or current_process:
+        if current_process is None and not ready:
+            current_time = max(current_time, pending.arrival_time)
+        while pending is not None and pending.arrival_time <= current_time:
+            heapq.heappush(ready, (pending.priority * interval + pending.arrival_time, seq, pending))
+            seq += 1
+            pending = next(arrivals, None)
+        if current_process is not None and ready:
+            holds = level if current_time < grace_end else current_process.priority
+            if _aged_level(ready[0][0], current_time, interval) < holds:
+                heapq.heappush(ready, (current_process.priority * interval + current_time, seq, current_process))
+                seq += 1
                 current_process = None
-        else:
-            current_time += 1
-    return completed, "SJF (Preemptive)", timeline
+        if current_process is None:
+            key, _, current_process = heapq.heappop(ready)
+            level, grace_end = _aged_level(key, current_time, interval), current_time + interval
+        if current_process.start_time is None:
+            current_process.start_time = current_time
+        start = current_time
+        current_time += current_process.remaining_time
+        if pending is not None:
+            current_time = min(current_time, pending.arrival_time)
+        if ready:
+            current_time = min(current_time, _aging_wakeup(ready[0][0], level, current_process.priority, grace_end, interval))
+        current_process.remaining_time -= current_time - start
+        finished = current_process.remaining_time <= 0
+        if finished:
+            _complete(current_process, current_time)
+        yield current_process, start, current_time, finished
+        if finished:
+            current_process = None
 
-def rr_scheduler(processes, quantum):
-    processes.sort(key=lambda x: x.arrival_time)
-    timeline = []
+def _rr_events(arrivals, quantum):
+    arrivals = iter(arrivals)
+    pending = next(arrivals, None)
     current_time = 0
-    queue = []
-    completed = []
-    while processes or queue:
-        while processes and processes[0].arrival_time <= current_time:
-            queue.append(processes.pop(0))
+    queue = deque()
+    while pending is not None or queue:
         if not queue:
-            current_time += 1
-            continue
-        p = queue.pop(0)
+            current_time = max(current_time, pending.arrival_time)
+        while pending is not None and pending.arrival_time <= current_time:
+            queue.append(pending)
+            pending = next(arrivals, None)
+        p = queue.popleft()
         if p.start_time is None:
             p.start_time = current_time
         time_slice = min(quantum, p.remaining_time)
-        timeline.append((p.pid, current_time, current_time + time_slice))
+        start = current_time
         current_time += time_slice
         p.remaining_time -= time_slice
         if p.remaining_time == 0:
-            p.end_time = current_time
-            p.turnaround_time = p.end_time - p.arrival_time
-            p.waiting_time = p.turnaround_time - p.burst_time
-            completed.append(p)
+            _complete(p, current_time)
         else:
             queue.append(p)
-    return completed, "Round Robin", timeline
+        yield p, start, current_time, p.remaining_time == 0
+
+def _mlfq_events(arrivals, quanta, boost_interval=None):
+    # Arrivals join the top level; a process that uses up its level's
+    # quantum drops a level. Every boost_interval time units (at the first
+    # dispatch at or after each multiple) everything waiting moves back to
+    # the top, so long jobs cannot starve behind a stream of short ones.
+    _check_mlfq(quanta, boost_interval)
+    arrivals = iter(arrivals)
+    pending = next(arrivals, None)
+    current_time = 0
+    queues = MLFQueues(len(quanta))
+    bottom = len(quanta) - 1
+    next_boost = boost_interval
+    while pending is not None or queues.size:
+        if not queues.size:
+            current_time = max(current_time, pending.arrival_time)
+        while pending is not None and pending.arrival_time <= current_time:
+            queues.push(pending, 0)
+            pending = next(arrivals, None)
+        if next_boost is not None and current_time >= next_boost:
+            queues.boost()
+            next_boost = (current_time // boost_interval + 1) * boost_interval
+        level, p = queues.pop()
+        if p.start_time is None:
+            p.start_time = current_time
+        time_slice = min(quanta[level], p.remaining_time)
+        start = current_time
+        current_time += time_slice
+        p.remaining_time -= time_slice
+        if p.remaining_time == 0:
+            _complete(p, current_time)
+        else:
+            queues.push(p, min(level + 1, bottom))
+        yield p, start, current_time, p.remaining_time == 0
+
+def fcfs_scheduler(processes):
+    processes.sort(key=lambda x: x.arrival_time)
+    return _collect(_fcfs_events(processes), "FCFS", processes)
+
+def sjf_non_preemptive(processes):
+    processes.sort(key=lambda x: x.arrival_time)
+    return _collect(_non_preemptive_events(processes, lambda p: p.burst_time), "SJF (Non-Preemptive)", processes)
+
+def sjf_preemptive(processes):
+    processes.sort(key=lambda x: x.arrival_time)
+    return _collect(_preemptive_events(processes, lambda p: p.remaining_time), "SJF (Preemptive)", processes)
+
+def rr_scheduler(processes, quantum):
+    processes.sort(key=lambda x: x.arrival_time)
+    return _collect(_rr_events(processes, quantum), "Round Robin", processes)
 
 def priority_non_preemptive(processes):
     processes.sort(key=lambda x: x.arrival_time)
-    timeline = []
-    current_time = 0
-    completed = []
-    while processes or any(p.arrival_time <= current_time for p in processes):
-        available = [p for p in processes if p.arrival_time <= current_time]
-        if not available:
-            current_time += 1
-            continue
-        available.sort(key=lambda x: x.priority)
-        p = available[0]
-        processes.remove(p)
-        p.start_time = current_time
-        timeline.append((p.pid, current_time, current_time + p.burst_time))
-        current_time += p.burst_time
-        p.end_time = current_time
-        p.turnaround_time = p.end_time - p.arrival_time
-        p.waiting_time = p.turnaround_time - p.burst_time
-        completed.append(p)
-    return completed, "Priority (Non-Preemptive)", timeline
+    return _collect(_non_preemptive_events(processes, lambda p: p.priority), "Priority (Non-Preemptive)", processes)
 
 def priority_preemptive(processes):
     processes.sort(key=lambda x: x.arrival_time)
-    timeline = []
-    current_time = 0
-    completed = []
-    current_process = None
-    while processes or current_process:
-        available = [p for p in processes if p.arrival_time <= current_time]
-        if available:
-            available.sort(key=lambda x: x.priority)
-            if current_process and current_process in processes and current_process.priority < min(p.priority for p in available):
-                available.append(current_process)
-            current_process = min(available, key=lambda x: x.priority)
-            if current_process in processes:
-                processes.remove(current_process)
-        if current_process and current_process not in completed:
-            if current_process.start_time is None:
-                current_process.start_time = current_time
-            execute_time = 1  # Preemptive step by step
-            timeline.append((current_process.pid, current_time, current_time + execute_time))
-            current_process.remaining_time -= execute_time
-            current_time += execute_time
-            if current_process.remaining_time <= 0:
-                current_process.end_time = current_time
-                current_process.turnaround_time = current_process.end_time - current_process.arrival_time
-                current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
-                completed.append(current_process)
-                current_process = None
-        else:
-            current_time += 1
-    return completed, "Priority (Preemptive)", timeline
+    return _collect(_preemptive_events(processes, lambda p: p.priority), "Priority (Preemptive)", processes)
 
-def mlfq_scheduler(processes, quanta):
+def priority_aging_non_preemptive(processes, interval=AGING_INTERVAL):
+    # Queued once, on arrival, so the aging key is fixed by the arrival time.
+    _check_aging(interval)
     processes.sort(key=lambda x: x.arrival_time)
-    timeline = []
-    current_time = 0
-    queues = [[] for _ in range(len(quanta))]
-    completed = []
-    queues[0].extend(processes)
-    processes.clear()
-    max_iterations = 10000  # Safeguard against infinite loops
-    iteration = 0
-
-    while any(queues):
-        if iteration > max_iterations:
-            print(f"Warning: MLFQ scheduler exceeded {max_iterations} iterations, terminating.")
-            break
-        iteration += 1
-        # Find the highest non-empty queue
-        current_queue = next((i for i, q in enumerate(queues) if q), len(queues))
-        if current_queue >= len(queues) and not queues[current_queue - 1]:
-            current_time += 1
-            continue
-        if current_queue < len(queues) and queues[current_queue]:
-            print(f"Processing queue {current_queue} at time {current_time}, queue sizes: {[len(q) for q in queues]}")
-            current_process = queues[current_queue].pop(0)
-            if current_process.start_time is None:
-                current_process.start_time = current_time
-            quantum = quanta[current_queue]
-            time_slice = min(quantum, current_process.remaining_time)
-            timeline.append((current_process.pid, current_time, current_time + time_slice))
-            current_time += time_slice
-            current_process.remaining_time -= time_slice
-            if current_process.remaining_time == 0:
-                current_process.end_time = current_time
-                current_process.turnaround_time = current_process.end_time - current_process.arrival_time
-                current_process.waiting_time = current_process.turnaround_time - current_process.burst_time
-                completed.append(current_process)
-            else:
-                next_queue = min(current_queue + 1, len(queues) - 1)
-                current_process.priority = next_queue
-                queues[next_queue].append(current_process)
-        # Handle new arrivals
-        new_arrivals = [p for p in processes if p.arrival_time <= current_time]
-        for p in new_arrivals:
-            processes.remove(p)
-            p.priority = 0
-            queues[0].append(p)
-    return completed, "MLFQ", timeline
+    events = _non_preemptive_events(processes, lambda p: p.priority * interval + p.arrival_time)
+    return _collect(events, "Priority Aging (Non-Preemptive)", processes)
+
+def priority_aging_preemptive(processes, interval=AGING_INTERVAL):
+    processes.sort(key=lambda x: x.arrival_time)
+    return _collect(_aging_events(processes, interval), "Priority Aging (Preemptive)", processes)
+
+def mlfq_scheduler(processes, quanta, boost_interval=None):
+    processes.sort(key=lambda x: x.arrival_time)
+    return _collect(_mlfq_events(processes, quanta, boost_interval), "MLFQ", processes)
+
+def mlfq_quanta(quantum, quanta=None):
+    # Per-level quanta: as given, or [q, 2q, 4q] by default.
+    return list(quanta) if quanta else [quantum, quantum * 2, quantum * 4]
+
+def _in_arrival_order(processes):
+    last_arrival = None
+    for p in processes:
+        if last_arrival is not None and p.arrival_time < last_arrival:
+            raise ValueError(f"Process {p.pid} arrives at {p.arrival_time}, before the previous arrival at {last_arrival}; "
+                             "streamed workloads must be sorted by arrival time")
+        last_arrival = p.arrival_time
+        yield p
+
+def iter_schedule(algo, arrivals, quantum, quanta=None, boost_interval=None):
+    # Lazily schedules an arrival-ordered stream of processes on one core,
+    # yielding (process, start, end, finished) for every dispatch. quanta
+    # and boost_interval only apply to MLFQ.
+    arrivals = _in_arrival_order(arrivals)
+    if algo == "FCFS":
+        return _fcfs_events(arrivals)
+    elif algo == "SJF-NP":
+        return _non_preemptive_events(arrivals, lambda p: p.burst_time)
+    elif algo == "SJF-P":
+        return _preemptive_events(arrivals, lambda p: p.remaining_time)
+    elif algo == "RR":
+        return _rr_events(arrivals, quantum)
+    elif algo == "PR-NP":
+        return _non_preemptive_events(arrivals, lambda p: p.priority)
+    elif algo == "PR-P":
+        return _preemptive_events(arrivals, lambda p: p.priority)
+    elif algo == "PR-NP-AGE":
+        return _non_preemptive_events(arrivals, lambda p: p.priority * AGING_INTERVAL + p.arrival_time)
+    elif algo == "PR-P-AGE":
+        return _aging_events(arrivals, AGING_INTERVAL)
+    elif algo == "MLFQ":
+        return _mlfq_events(arrivals, mlfq_quanta(quantum, quanta), boost_interval)
+    else:
+        raise ValueError(f"{algo} needs the whole workload up front and cannot be streamed")
+
+class RunningMetrics:
+    # Incremental counterpart of calculate_metrics: O(1) per finished process
+    # and no reference to the processes themselves.
+    __slots__ = ("count", "total_wait", "total_turn", "total_burst", "end_time", "max_wait", "max_turn")
+
+    def __init__(self):
+        self.count = 0
+        self.total_wait = 0
+        self.total_turn = 0
+        self.total_burst = 0
+        self.end_time = 0
+        self.max_wait = 0
+        self.max_turn = 0
+
+    def add(self, process):
+        self.count += 1
+        self.total_wait += process.waiting_time
+        self.total_turn += process.turnaround_time
+        self.total_burst += process.burst_time
+        self.end_time = max(self.end_time, process.end_time)
+        self.max_wait = max(self.max_wait, process.waiting_time)
+        self.max_turn = max(self.max_turn, process.turnaround_time)
+
+    def metrics(self):
+        if not self.count:
+            return 0, 0, 0, 0
+        avg_wait = self.total_wait / self.count
+        avg_turn = self.total_turn / self.count
+        cpu_util = (self.total_burst / self.end_time) * 100 if self.end_time > 0 else 0
+        throughput = self.count / self.end_time if self.end_time > 0 else 0
+        return avg_wait, avg_turn, cpu_util, throughput
+
+def _intelligent_choice(processes, quantum):
+    # The same trained predictor the GUI uses (see ai_scheduler.py).
+    return AIScheduler().predict_best_algorithm(processes, quantum)
 
 def intelligent_scheduler(processes, quantum):
-    total_priority = sum(p.priority for p in processes)
-    avg_priority = total_priority / len(processes) if processes else 0
-    total_burst = sum(p.burst_time for p in processes)
-    avg_burst = total_burst / len(processes) if processes else 0
-    if avg_priority <= 2 and avg_burst <= 5:
-        return sjf_preemptive(processes)
-    elif avg_priority > 2 and avg_burst > 5:
-        return priority_preemptive(processes)
+    return _run_algorithm(_intelligent_choice(processes, quantum), processes, quantum, 1)
+
+COMPARISON_ALGORITHMS = ["FCFS", "SJF-NP", "SJF-P", "RR", "PR-NP", "PR-P", "PR-NP-AGE", "PR-P-AGE", "MLFQ", "Intelligent"]
+ALGORITHM_NAMES = {
+    "FCFS": "FCFS",
+    "SJF-NP": "SJF (Non-Preemptive)",
+    "SJF-P": "SJF (Preemptive)",
+    "RR": "Round Robin",
+    "PR-NP": "Priority (Non-Preemptive)",
+    "PR-P": "Priority (Preemptive)",
+    "PR-NP-AGE": "Priority Aging (Non-Preemptive)",
+    "PR-P-AGE": "Priority Aging (Preemptive)",
+    "MLFQ": "MLFQ"
+}
+
+def _policy_for(algo, quantum, quanta=None, boost_interval=None):
+    if algo == "FCFS":
+        return SchedulingPolicy()
+    elif algo == "SJF-NP":
+        return SJFPolicy(preemptive=False)
+    elif algo == "SJF-P":
+        return SJFPolicy(preemptive=True)
+    elif algo == "RR":
+        return RoundRobinPolicy(quantum)
+    elif algo == "PR-NP":
+        return PriorityPolicy(preemptive=False)
+    elif algo == "PR-P":
+        return PriorityPolicy(preemptive=True)
+    elif algo == "PR-NP-AGE":
+        return AgingPriorityPolicy(preemptive=False)
+    elif algo == "PR-P-AGE":
+        return AgingPriorityPolicy(preemptive=True)
+    elif algo == "MLFQ":
+        return MLFQPolicy(mlfq_quanta(quantum, quanta), boost_interval)
     else:
-        return rr_scheduler(processes, quantum)
\ No newline at end of file
+        raise ValueError(f"Unknown algorithm: {algo}")
+
+def step_schedule(algo, processes, quantum, num_cores=1, quanta=None, boost_interval=None):
+    # Resumable counterpart of run_algorithm: returns the algorithm name and
+    # a generator of (process, start, end, finished, core) events, so the
+    # caller can advance the simulation one dispatch at a time. Like the
+    # single-core schedulers, it runs on (and sorts) the processes given.
+    if algo == "Intelligent":
+        algo = _intelligent_choice(processes, quantum)
+    if algo not in ALGORITHM_NAMES:
+        raise ValueError(f"Unknown algorithm: {algo}")
+    if isinstance(processes, ProcessTable):
+        # Views are created as the engine reaches each arrival rather than
+        # up front, and the table is only sorted if it is out of order.
+        table = processes
+        order = range(len(table))
+        if not all(map(le, table.arrival, table.arrival[1:])):
+            order = sorted(order, key=table.arrival.__getitem__)
+        processes = map(table.view, order)
+    else:
+        processes.sort(key=lambda x: x.arrival_time)
+    if num_cores == 1:
+        events = iter_schedule(algo, processes, quantum, quanta, boost_interval)
+        return ALGORITHM_NAMES[algo], ((p, start, end, finished, 0) for p, start, end, finished in events)
+    policy = _policy_for(algo, quantum, quanta, boost_interval)
+    return f"{policy.name} (Multi-Core)", _smp_events(processes, num_cores, policy)
+
+def run_algorithm(algo, processes, quantum, num_cores=1, cache=RESULT_CACHE, quanta=None, boost_interval=None):
+    # Results are memoized on the workload's contents and the run
+    # parameters; pass cache=None to always recompute. The cache keeps its
+    # own snapshot, but the results it hands out are shared, so callers must
+    # treat them as read-only. quanta overrides
+    # MLFQ's default per-level quanta of [q, 2q, 4q], one entry per level;
+    # boost_interval moves every waiting MLFQ process back to the top level
+    # that often (default: never).
+    key = None
+    if cache is not None:
+        key = cache_key(workload_fingerprint(processes), algo, quantum, num_cores, quanta, boost_interval)
+        result = cache.get(key)
+        if result is not None:
+            return result
+    with INSTRUMENTATION.span("run_algorithm", algorithm=algo, quantum=quantum, cores=num_cores, processes=len(processes)):
+        result = _run_algorithm(algo, processes, quantum, num_cores, quanta, boost_interval)
+    if key is not None:
+        cache.put(key, result)
+    return result
+
+def _run_algorithm(algo, processes, quantum, num_cores, quanta=None, boost_interval=None):
+    if isinstance(processes, ProcessTable):
+        processes = processes.views()
+    if algo == "FCFS":
+        return multi_core_scheduler(processes, num_cores, fcfs_scheduler, SchedulingPolicy())
+    elif algo == "SJF-NP":
+        return multi_core_scheduler(processes, num_cores, sjf_non_preemptive, SJFPolicy(preemptive=False))
+    elif algo == "SJF-P":
+        return multi_core_scheduler(processes, num_cores, sjf_preemptive, SJFPolicy(preemptive=True))
+    elif algo == "RR":
+        return multi_core_scheduler(processes, num_cores, lambda p: rr_scheduler(p, quantum), RoundRobinPolicy(quantum))
+    elif algo == "PR-NP":
+        return multi_core_scheduler(processes, num_cores, priority_non_preemptive, PriorityPolicy(preemptive=False))
+    elif algo == "PR-P":
+        return multi_core_scheduler(processes, num_cores, priority_preemptive, PriorityPolicy(preemptive=True))
+    elif algo == "PR-NP-AGE":
+        return multi_core_scheduler(processes, num_cores, priority_aging_non_preemptive, AgingPriorityPolicy(preemptive=False))
+    elif algo == "PR-P-AGE":
+        return multi_core_scheduler(processes, num_cores, priority_aging_preemptive, AgingPriorityPolicy(preemptive=True))
+    elif algo == "MLFQ":
+        quanta = mlfq_quanta(quantum, quanta)
+        return multi_core_scheduler(processes, num_cores, lambda p: mlfq_scheduler(p, quanta, boost_interval),
+                                    MLFQPolicy(quanta, boost_interval))
+    elif algo == "Intelligent":
+        return _run_algorithm(_intelligent_choice(processes, quantum), processes, quantum, num_cores, quanta, boost_interval)
+    else:
+        raise ValueError(f"Unknown algorithm: {algo}")
+
+def simulate_algorithm(algo, processes, quantum, num_cores=1, cache=RESULT_CACHE, quanta=None, boost_interval=None):
+    # Module-level so it can be shipped to a process pool worker.
+    return summarize_run(*run_algorithm(algo, processes, quantum, num_cores, cache, quanta, boost_interval))
+
+def summarize_run(processes, algo_name, timeline):
+    result = {"processes": processes, "timeline": timeline}
+    result.update(calculate_extended_metrics(processes))
+    return algo_name, result
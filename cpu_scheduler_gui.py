@@ -1,24 +1,39 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import random
-import json
 import logging
-import threading
+import os
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from cpu_scheduler_algorithms import *
 from cpu_scheduler_visualization import SchedulerVisualizer
 from performance_metrics import PerformanceMetrics
 from ai_scheduler import AIScheduler
+from workload_io import load_table, write_records
+from workload_generator import ARRIVAL_PATTERNS, BURST_DISTRIBUTIONS, WorkloadGenerator, parse_mix
+from timeline_store import Timeline
+from virtual_table import TableModel, VirtualTable
+from result_cache import RESULT_CACHE, cache_key, workload_fingerprint
+from simulation_service import SimulationService, prepare_steps, simulate
+from custom_policy import POLICY_TEMPLATE, PolicySandbox
+from parameter_sweep import (LOWER_IS_BETTER, SWEEP_METRICS, parse_int_list, parse_quanta_vectors,
+                             run_sweep, surface)
 import time
 
 # Set up logging
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler("scheduler.log"),
         logging.StreamHandler()
     ]
 )
+# PIL logs every PNG chunk it reads at DEBUG level.
+logging.getLogger("PIL").setLevel(logging.WARNING)
+
+TRACE_FILETYPES = [("JSON files", "*.json"), ("JSON Lines traces", "*.jsonl *.ndjson"),
+                   ("CSV traces", "*.csv"), ("Binary traces", "*.trace")]
 
 class SchedulerGUI:
     def __init__(self, root):
@@ -49,19 +64,41 @@ class SchedulerGUI:
         # Enhanced modern theme with gradients and styled widgets
         self.setup_modern_theme()
 
-        self.processes = []
+        self.processes = ProcessTable()
         self.process_entries = []
         self.step_mode = False
         self.current_step = 0
-        self.step_timeline = []
+        self.step_events = None
+        self.step_metrics = None
         self.current_processes = []
         self.current_algo_name = "N/A"
         self.timeline = []
         self.num_cores = 1
         self.ai_scheduler = AIScheduler()
         self.comparison_results = {}
-        self.process_listbox = None
-        self.comparison_thread = None
+        self.comparison_order = {}
+        self.comparison_done = 0
+        self.comparison_executor = None
+        self.process_view = None
+        self.result_rows = []
+        self.process_model = TableModel(["PID", "Arrival", "Burst", "Priority"], lambda: len(self.processes),
+                                        lambda i: (self.processes.pids[i], self.processes.arrival[i],
+                                                   self.processes.burst[i], self.processes.priority[i]))
+        self.result_model = TableModel(["PID", "Start", "End", "Waiting", "Turnaround"], lambda: len(self.result_rows),
+                                       lambda i: self._result_row(self.result_rows[i]))
+        self.comparison_model = TableModel(["Algorithm", "Avg Wait", "Avg Turn", "P99 Wait", "P99 Turn", "CPU Util", "Throughput", "Fairness"],
+                                           lambda: len(self.comparison_results), self._comparison_row, self._format_comparison_row)
+        self.sweep_rows = []
+        # Simulations, comparisons and sweeps run in the background; results
+        # come back to the Tk thread through the service's poll.
+        self.service = SimulationService(self.root.after)
+        self.policy_sandbox = PolicySandbox()
+        self.progress_var = tk.DoubleVar(value=0)
+        self.sweep_quanta_var = tk.StringVar(value="1-8")
+        self.sweep_cores_var = tk.StringVar(value="1,2,4")
+        self.sweep_mlfq_var = tk.StringVar(value="")
+        self.sweep_metric_var = tk.StringVar(value="avg_wait")
+        self.sweep_core_choice = tk.StringVar(value="1")
 
         nav_items = [
             ("Process Management", self.show_process_management),
@@ -301,14 +338,11 @@ class SchedulerGUI:
         input_frame = ttk.LabelFrame(self.process_management_frame, text="Process Configuration", padding=5, style="Modern.TFrame")
         input_frame.pack(fill="x", pady=0)
 
-        listbox_frame = ttk.Frame(input_frame)
-        listbox_frame.pack(fill="both", expand=True, pady=2)
-        if self.process_listbox is None or not self.process_listbox.winfo_exists():
-            self.process_listbox = tk.Listbox(listbox_frame, height=10, bg="#4A6B9A", fg="#E6E6FA")
-        self.process_listbox.pack(side="left", fill="both", expand=True)
-        scrollbar = ttk.Scrollbar(listbox_frame, orient="vertical", command=self.process_listbox.yview, style="Vertical.TScrollbar")
-        scrollbar.pack(side="right", fill="y")
-        self.process_listbox.configure(yscrollcommand=scrollbar.set)
+        # Only the visible rows exist as widgets; sorting (click a heading)
+        # and filtering work on the process table itself.
+        self.process_model.refresh()
+        self.process_view = VirtualTable(input_frame, self.process_model, height=10)
+        self.process_view.pack(fill="both", expand=True, pady=2)
 
         input_subframe = ttk.Frame(input_frame)
         input_subframe.pack(fill="x", pady=2)
@@ -327,6 +361,7 @@ class SchedulerGUI:
         btn_configs = [
             ("Add Process", self.add_process),
             ("Random Processes", self.add_random_processes),
+            ("Generate Workload", self.generate_workload),
             ("Clear All", self.clear_all),
             ("Save Config", self.save_config),
             ("Load Config", self.load_config)
@@ -335,13 +370,15 @@ class SchedulerGUI:
             btn = ttk.Button(button_frame, text=text, command=cmd, style="Modern.TButton")
             btn.pack(side="left", padx=2)
 
-    def update_process_listbox(self):
-        if self.process_listbox is None or not self.process_listbox.winfo_exists():
-            self.status_var.set("Error: Process listbox not initialized or destroyed")
-            return
-        self.process_listbox.delete(0, tk.END)
-        for p in self.processes:
-            self.process_listbox.insert(tk.END, f"{p.pid}: Arrival={p.arrival_time}, Burst={p.burst_time}, Priority={p.priority}")
+    def update_process_listbox(self, added=0):
+        # added > 0: that many processes were appended, so place just those.
+        if self.process_view is None or not self.process_view.winfo_exists():
+            self.process_model.refresh()
+        elif added:
+            for i in range(len(self.processes) - added, len(self.processes)):
+                self.process_view.row_added(i)
+        else:
+            self.process_view.refresh()
         self.status_var.set(f"Updated process list: {len(self.processes)} processes")
 
     def add_process(self):
@@ -352,9 +389,8 @@ class SchedulerGUI:
             priority = int(self.new_process_entries[3].get())
             if arrival < 0 or burst <= 0:
                 raise ValueError("Arrival must be >= 0, Burst must be > 0")
-            process = Process(pid, arrival, burst, priority)
-            self.processes.append(process)
-            self.update_process_listbox()
+            self.processes.append(pid, arrival, burst, priority)
+            self.update_process_listbox(added=1)
             self.new_process_entries[0].delete(0, tk.END)
             self.new_process_entries[0].insert(0, f"P{len(self.processes) + 1}")
             self.status_var.set(f"Added process {pid}")
@@ -369,32 +405,70 @@ class SchedulerGUI:
             arrival = random.randint(0, 10)
             burst = random.randint(1, 10)
             priority = random.randint(0, 5)
-            self.processes.append(Process(pid, arrival, burst, priority))
-        self.update_process_listbox()
+            self.processes.append(pid, arrival, burst, priority)
+        self.update_process_listbox(added=num_processes)
         self.status_var.set(f"Added {num_processes} random processes")
 
+    def generate_workload(self):
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Generate Workload")
+        dialog.configure(bg="#1A2A44")
+        fields = [("Processes", "entry", "1000"), ("Seed (blank = random)", "entry", ""),
+                  ("Arrivals", ARRIVAL_PATTERNS, "poisson"), ("Arrival Rate", "entry", "0.18"),
+                  ("Bursts", BURST_DISTRIBUTIONS, "lognormal"), ("Mean Burst", "entry", "5"),
+                  ("Shape (sigma / alpha)", "entry", "1.0"), ("Priority Mix", "entry", "0-5")]
+        values = []
+        for row, (label, kind, default) in enumerate(fields):
+            ttk.Label(dialog, text=label, style="Modern.TLabel").grid(row=row, column=0, padx=5, pady=2, sticky="e")
+            var = tk.StringVar(value=default)
+            if kind == "entry":
+                ttk.Entry(dialog, textvariable=var, width=14, style="TEntry").grid(row=row, column=1, padx=5, pady=2)
+            else:
+                ttk.Combobox(dialog, textvariable=var, values=kind, state="readonly", width=12).grid(row=row, column=1, padx=5, pady=2)
+            values.append(var)
+
+        def on_generate():
+            count, seed, arrival, rate, burst, mean_burst, shape, mix = (var.get().strip() for var in values)
+            try:
+                if int(count) <= 0:
+                    raise ValueError("Processes must be > 0")
+                generator = WorkloadGenerator(int(seed) if seed else None, arrival, float(rate), burst,
+                                              float(mean_burst), float(shape), parse_mix(mix))
+            except ValueError as e:
+                messagebox.showerror("Error", str(e), parent=dialog)
+                return
+            dialog.destroy()
+            self.status_var.set("Generating workload...")
+            self.root.update_idletasks()
+            self.processes = generator.table(int(count))
+            self.update_process_listbox()
+            self.status_var.set(f"Generated {count} processes (seed {generator.seed})")
+
+        ttk.Button(dialog, text="Generate", command=on_generate, style="Modern.TButton").grid(row=len(fields), column=0, columnspan=2, pady=10)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
     def clear_all(self):
         self.processes.clear()
         self.update_process_listbox()
         self.status_var.set("Cleared all processes")
 
     def save_config(self):
-        config = [{"pid": p.pid, "arrival": p.arrival_time, "burst": p.burst_time, "priority": p.priority} 
-                  for p in self.processes]
-        file = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        records = [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in self.processes]
+        file = filedialog.asksaveasfilename(defaultextension=".json", filetypes=TRACE_FILETYPES)
         if file:
-            with open(file, "w") as f:
-                json.dump(config, f)
+            write_records(file, records)
             self.status_var.set(f"Saved configuration to {file}")
 
     def load_config(self):
-        file = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+        file = filedialog.askopenfilename(filetypes=TRACE_FILETYPES)
         if file:
-            with open(file, "r") as f:
-                config = json.load(f)
-            self.processes.clear()
-            for proc in config:
-                self.processes.append(Process(proc["pid"], proc["arrival"], proc["burst"], proc["priority"]))
+            try:
+                self.processes = load_table(file)
+            except (OSError, ValueError, KeyError) as e:
+                messagebox.showerror("Error", f"Could not load {file}: {str(e)}", parent=self.root)
+                self.status_var.set("Error loading configuration")
+                return
             self.update_process_listbox()
             self.status_var.set(f"Loaded configuration from {file}")
 
@@ -408,13 +482,14 @@ class SchedulerGUI:
         algos = [
             ("FCFS", "FCFS"), ("SJF (NP)", "SJF-NP"), ("SJF (P)", "SJF-P"),
             ("Round Robin", "RR"), ("Priority (NP)", "PR-NP"), ("Priority (P)", "PR-P"),
+            ("Priority Aging (NP)", "PR-NP-AGE"), ("Priority Aging (P)", "PR-P-AGE"),
             ("MLFQ", "MLFQ"), ("Intelligent", "Intelligent"), ("Custom", "Custom")
         ]
         algo_subframe = ttk.Frame(algo_frame)
         algo_subframe.pack(fill="x", pady=2)
         for i, (text, value) in enumerate(algos):
             btn = ttk.Radiobutton(algo_subframe, text=text, variable=self.algo_var, value=value, style="TRadiobutton")
-            btn.grid(row=0, column=i, padx=5, pady=2)
+            btn.grid(row=i // 6, column=i % 6, padx=5, pady=2, sticky="w")
 
         settings_frame = ttk.Frame(algo_frame)
         settings_frame.pack(fill="x", pady=2)
@@ -427,12 +502,21 @@ class SchedulerGUI:
         self.cores_var = tk.StringVar(value="1")
         ttk.Entry(settings_frame, textvariable=self.cores_var, width=5, style="TEntry").grid(row=0, column=3, padx=5)
 
+        # Blank means MLFQ's defaults: [q, 2q, 4q] and no priority boost.
+        ttk.Label(settings_frame, text="MLFQ Quanta:", style="Modern.TLabel").grid(row=0, column=4, padx=5, sticky="e")
+        self.mlfq_quanta_var = tk.StringVar(value="")
+        ttk.Entry(settings_frame, textvariable=self.mlfq_quanta_var, width=10, style="TEntry").grid(row=0, column=5, padx=5)
+
+        ttk.Label(settings_frame, text="Boost Every:", style="Modern.TLabel").grid(row=0, column=6, padx=5, sticky="e")
+        self.boost_var = tk.StringVar(value="")
+        ttk.Entry(settings_frame, textvariable=self.boost_var, width=5, style="TEntry").grid(row=0, column=7, padx=5)
+
         self.custom_algo_frame = ttk.Frame(algo_frame)
         self.custom_algo_frame.pack(fill="both", expand=True, pady=2)
-        ttk.Label(self.custom_algo_frame, text="Custom Algorithm (Python Code):", style="Modern.TLabel").pack(anchor="w")
-        self.custom_algo_text = tk.Text(self.custom_algo_frame, height=5, width=50, bg="#4A6B9A", fg="#E6E6FA", insertbackground="#B0B0FF")
+        ttk.Label(self.custom_algo_frame, text="Custom Policy (Python Code):", style="Modern.TLabel").pack(anchor="w")
+        self.custom_algo_text = tk.Text(self.custom_algo_frame, height=8, width=50, bg="#4A6B9A", fg="#E6E6FA", insertbackground="#B0B0FF")
         self.custom_algo_text.pack(fill="both", expand=True, pady=2)
-        self.custom_algo_text.insert(tk.END, "# Define your custom scheduling algorithm here\ndef custom_scheduler(processes, quantum):\n    return processes, 'Custom', []")
+        self.custom_algo_text.insert(tk.END, POLICY_TEMPLATE)
 
         control_frame = ttk.Frame(algo_frame)
         control_frame.pack(pady=5)
@@ -440,26 +524,53 @@ class SchedulerGUI:
             ("Run Simulation", self.run_simulation, "Run.TButton"),
             ("Step Simulation", self.start_step_mode, "Step.TButton"),
             ("View Gantt", self.view_gantt, "Gantt.TButton"),
-            ("Compare All", self.run_comparison, "Compare.TButton")
+            ("Compare All", self.run_comparison, "Compare.TButton"),
+            ("Cancel", self.cancel_simulation, "Modern.TButton")
         ]
         for text, cmd, style_name in btn_configs:
             btn = ttk.Button(control_frame, text=text, command=cmd, style=style_name)
             btn.pack(side="left", padx=2)
+        ttk.Progressbar(algo_frame, variable=self.progress_var, maximum=100, mode="determinate").pack(fill="x", padx=5, pady=2)
 
         test_btn = ttk.Button(algo_frame, text="Test Code", command=self.test_custom_code, style="Test.TButton")
         test_btn.pack(pady=5)
 
     def test_custom_code(self):
+        # A dry run on a small sample workload, in the same sandbox.
+        if self.service.busy("test"):
+            return
         custom_code = self.custom_algo_text.get("1.0", tk.END)
         try:
-            local_vars = {"processes": [], "quantum": 2}
-            exec(custom_code, globals(), local_vars)
-            result = local_vars.get("custom_scheduler", lambda p, q: (p, "Custom", []))(local_vars["processes"], local_vars["quantum"])
-            messagebox.showinfo("Test Result", f"Custom code executed: {result}", parent=self.root)
-            self.status_var.set("Custom code tested successfully")
-        except Exception as e:
-            messagebox.showerror("Error", f"Test failed: {str(e)}", parent=self.root)
-            self.status_var.set("Custom code test failed")
+            quantum = int(self.quantum_var.get())
+        except ValueError:
+            quantum = 2
+        self.status_var.set("Testing custom code...")
+        self.service.submit("test", self._custom_task, custom_code, WorkloadGenerator(0).table(20), quantum, 1,
+                            on_done=self._custom_test_done, on_error=self._custom_test_failed,
+                            on_cancel=lambda: self.status_var.set("Custom code test cancelled"))
+
+    def _custom_test_done(self, result):
+        processes, algo_name, timeline = result
+        avg_wait, avg_turn, _, _ = calculate_metrics(processes)
+        messagebox.showinfo("Test Result", f"{algo_name}: {len(processes)} of 20 sample processes finished, "
+                                           f"{len(timeline)} timeline segments, avg wait {avg_wait:.2f}, "
+                                           f"avg turnaround {avg_turn:.2f}", parent=self.root)
+        self.status_var.set("Custom code tested successfully")
+
+    def _custom_test_failed(self, error):
+        messagebox.showerror("Error", f"Test failed: {str(error)}", parent=self.root)
+        self.status_var.set("Custom code test failed")
+
+    def mlfq_settings(self):
+        # (quanta, boost interval) from the MLFQ entries, None where blank.
+        vectors = parse_quanta_vectors(self.mlfq_quanta_var.get())
+        if len(vectors) > 1:
+            raise ValueError("Give one MLFQ quanta vector, e.g. 2/4/8")
+        boost = self.boost_var.get().strip()
+        boost_interval = int(boost) if boost else None
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError(f"Invalid MLFQ boost interval {boost_interval}: must be > 0")
+        return (list(vectors[0]) if vectors else None), boost_interval
 
     def run_simulation(self):
         if not self.processes:
@@ -467,95 +578,156 @@ class SchedulerGUI:
                 self.status_var.set("Simulation cancelled: No processes")
                 return
             self.add_random_processes()
+        if self.service.busy("simulation"):
+            self.status_var.set("Simulation already in progress...")
+            return
         try:
-            self.status_var.set("Running simulation...")
             self.num_cores = int(self.cores_var.get())
             algo = self.algo_var.get()
             quantum = int(self.quantum_var.get())
-            if algo == "Custom":
-                custom_code = self.custom_algo_text.get("1.0", tk.END)
-                processes, algo_name, timeline = self.run_custom_algorithm(custom_code, self.processes[:], quantum)
-            elif algo == "Intelligent":
-                predicted_algo = self.ai_scheduler.predict_best_algorithm(self.processes)
-                processes, algo_name, timeline = self.run_algorithm(predicted_algo, self.processes[:], quantum)
-                algo_name = f"Intelligent ({predicted_algo})"
-            else:
-                processes, algo_name, timeline = self.run_algorithm(algo, self.processes[:], quantum)
-            self.current_processes = processes
-            self.current_algo_name = algo_name
-            self.timeline = timeline
-            self.show_results()
-            self.display_results(processes, algo_name, *calculate_metrics(processes))
-            self.status_var.set("Simulation completed")
-        except Exception as e:
+            quanta, boost_interval = self.mlfq_settings()
+        except ValueError as e:
             messagebox.showerror("Error", f"Simulation failed: {str(e)}", parent=self.root)
             self.status_var.set("Simulation failed")
-
-    def run_algorithm(self, algo, processes, quantum):
-        if algo == "FCFS":
-            return multi_core_scheduler(processes, self.num_cores, fcfs_scheduler)
-        elif algo == "SJF-NP":
-            return multi_core_scheduler(processes, self.num_cores, sjf_non_preemptive)
-        elif algo == "SJF-P":
-            return multi_core_scheduler(processes, self.num_cores, sjf_preemptive)
-        elif algo == "RR":
-            return multi_core_scheduler(processes, self.num_cores, lambda p: rr_scheduler(p, quantum))
-        elif algo == "PR-NP":
-            return multi_core_scheduler(processes, self.num_cores, priority_non_preemptive)
-        elif algo == "PR-P":
-            return multi_core_scheduler(processes, self.num_cores, priority_preemptive)
-        elif algo == "MLFQ":
-            return multi_core_scheduler(processes, self.num_cores, lambda p: mlfq_scheduler(p, [quantum, quantum * 2, quantum * 4]))
-        elif algo == "Intelligent":
-            return multi_core_scheduler(processes, self.num_cores, lambda p: intelligent_scheduler(p, quantum))
+            return
+        self.status_var.set("Running simulation...")
+        self.progress_var.set(0)
+        if algo == "Custom":
+            custom_code = self.custom_algo_text.get("1.0", tk.END)
+            task, args = self._custom_task, (custom_code, self.processes.copy(), quantum, self.num_cores)
         else:
-            raise ValueError(f"Unknown algorithm: {algo}")
-
-    def run_custom_algorithm(self, code, processes, quantum):
-        local_vars = {"processes": processes, "quantum": quantum}
-        exec(code, globals(), local_vars)
-        return local_vars.get("custom_scheduler", lambda p, q: (p, "Custom", []))(processes, quantum)
+            task, args = simulate, (algo, self.processes.copy(), quantum, self.num_cores, RESULT_CACHE, quanta, boost_interval)
+        self.service.submit("simulation", task, *args, on_progress=self._simulation_progress,
+                            on_done=self._simulation_done, on_error=self._simulation_failed,
+                            on_cancel=self._simulation_cancelled)
+
+    def _custom_task(self, job, code, processes, quantum, num_cores):
+        # Custom code runs in the sandbox's worker process, never in this one.
+        return self.policy_sandbox.run(code, processes, quantum, num_cores, check=job.check)
+
+    def _simulation_progress(self, clock, horizon, finished, total):
+        # Simulated time against a lower bound on the makespan; the bar
+        # stops short of the end until the run is actually done.
+        fraction = min(clock / horizon, 0.99) if horizon else 0
+        self.progress_var.set(fraction * 100)
+        self.status_var.set(f"Simulating: t={clock:,}, {finished:,} of {total:,} processes finished ({fraction:.0%})")
+
+    def _simulation_done(self, result):
+        processes, algo_name, timeline = result
+        self.progress_var.set(100)
+        self.current_processes = processes
+        self.current_algo_name = algo_name
+        self.timeline = timeline
+        self.show_results()
+        self.display_results(processes, algo_name, *calculate_metrics(processes))
+        self.status_var.set("Simulation completed")
+
+    def _simulation_failed(self, error):
+        self.progress_var.set(0)
+        messagebox.showerror("Error", f"Simulation failed: {str(error)}", parent=self.root)
+        self.status_var.set("Simulation failed")
+
+    def _simulation_cancelled(self):
+        self.progress_var.set(0)
+        self.status_var.set("Simulation cancelled")
+
+    def cancel_simulation(self):
+        # Stops whatever is running: a simulation, comparison or sweep
+        # (at its next check), or step mode.
+        if self.service.busy():
+            self.service.cancel()
+            self.status_var.set("Cancelling...")
+        elif self.step_mode:
+            self.step_mode = False
+            self.step_events = None
+            self.status_var.set("Step mode stopped")
 
     def start_step_mode(self):
+        # While stepping, the button advances one dispatch; Cancel ends it.
+        if self.step_mode:
+            self.step_simulation()
+            return
         if not self.processes:
             if not messagebox.askyesno("Warning", "No processes added. Add random processes?", parent=self.root):
                 self.status_var.set("Step mode cancelled: No processes")
                 return
             self.add_random_processes()
+        if self.service.busy("simulation"):
+            self.status_var.set("Simulation already in progress...")
+            return
         try:
-            self.status_var.set("Starting step mode...")
             self.num_cores = int(self.cores_var.get())
             algo = self.algo_var.get()
             quantum = int(self.quantum_var.get())
-            if algo == "Custom":
-                custom_code = self.custom_algo_text.get("1.0", tk.END)
-                self.step_processes, self.current_algo_name, self.step_timeline = self.run_custom_algorithm(custom_code, self.processes[:], quantum)
-            elif algo == "Intelligent":
-                predicted_algo = self.ai_scheduler.predict_best_algorithm(self.processes)
-                self.step_processes, self.current_algo_name, self.step_timeline = self.run_algorithm(predicted_algo, self.processes[:], quantum)
-                self.current_algo_name = f"Intelligent ({predicted_algo})"
-            else:
-                self.step_processes, self.current_algo_name, self.step_timeline = self.run_algorithm(algo, self.processes[:], quantum)
-            self.step_mode = True
-            self.current_step = 0
-            self.timeline = self.step_timeline
-            self.show_results()
-            self.step_simulation()
-            self.status_var.set("Step mode started")
-        except Exception as e:
+            quanta, boost_interval = self.mlfq_settings()
+        except ValueError as e:
             messagebox.showerror("Error", f"Step mode failed: {str(e)}", parent=self.root)
             self.status_var.set("Step mode failed")
+            return
+        self.status_var.set("Starting step mode...")
+        # The schedule is generated lazily, one dispatch per step, so each
+        # step costs O(1); only the setup (prediction, sorting, or a whole
+        # custom run) happens in the background.
+        if algo == "Custom":
+            custom_code = self.custom_algo_text.get("1.0", tk.END)
+            task, args = self._custom_steps_task, (custom_code, self.processes.copy(), quantum, self.num_cores)
+        else:
+            task, args = prepare_steps, (algo, self.processes.copy(), quantum, self.num_cores, quanta, boost_interval)
+        self.service.submit("simulation", task, *args, on_done=self._step_mode_ready,
+                            on_error=self._step_mode_failed, on_cancel=lambda: self.status_var.set("Step mode cancelled"))
+
+    def _custom_steps_task(self, job, code, processes, quantum, num_cores):
+        processes, algo_name, timeline = self._custom_task(job, code, processes, quantum, num_cores)
+        return algo_name, self.replay_events(processes, timeline)
+
+    def _step_mode_ready(self, result):
+        self.current_algo_name, self.step_events = result
+        self.step_mode = True
+        self.current_step = 0
+        self.step_metrics = RunningMetrics()
+        self.current_processes = []
+        self.timeline = Timeline()
+        self.show_results()
+        self.display_results([], self.current_algo_name, *self.step_metrics.metrics())
+        self.step_simulation()
+        self.status_var.set("Step mode started")
+
+    def _step_mode_failed(self, error):
+        messagebox.showerror("Error", f"Step mode failed: {str(error)}", parent=self.root)
+        self.status_var.set("Step mode failed")
+
+    @staticmethod
+    def replay_events(processes, timeline):
+        # A custom scheduler hands back a finished run; step through its
+        # timeline, reporting each process as finished on its last segment.
+        by_pid = {p.pid: p for p in processes}
+        last_segment = {pid: i for i, (pid, _, _) in enumerate(timeline)}
+        for i, (pid, start, end, core) in enumerate(timeline.segments()):
+            process = by_pid.get(pid)
+            if process is not None:
+                yield process, start, end, last_segment[pid] == i, core
 
     def step_simulation(self):
-        if not self.step_mode or self.current_step >= len(self.step_timeline):
+        if not self.step_mode:
+            return
+        event = next(self.step_events, None)
+        if event is None:
             self.step_mode = False
-            self.display_results(self.step_processes, self.current_algo_name, *calculate_metrics(self.step_processes))
+            self.step_events = None
             self.status_var.set("Step mode completed")
             return
+        process, start, end, finished, core = event
         self.current_step += 1
-        self.timeline = self.step_timeline[:self.current_step]
-        self.display_results(self.step_processes, self.current_algo_name, *calculate_metrics(self.step_processes))
-        self.status_var.set(f"Step {self.current_step} of {len(self.step_timeline)}")
+        if end > start:
+            self.timeline.append(process.pid, start, end, core)
+        if finished:
+            self.step_metrics.add(process)
+            self.current_processes.append(process)
+            self.insert_result_row(process)
+        self.display_metrics(self.current_algo_name, *self.step_metrics.metrics())
+        self.status_var.set(f"Step {self.current_step}: {process.pid} ran {start}-{end}"
+                            + (f" on core {core}" if self.num_cores > 1 else "")
+                            + f" ({self.step_metrics.count} of {len(self.processes)} finished)")
 
     def build_results(self):
         for widget in self.results_frame.winfo_children():
@@ -574,13 +746,11 @@ class SchedulerGUI:
         self.throughput_label = ttk.Label(result_frame, text="Throughput: N/A", style="Modern.TLabel")
         self.throughput_label.pack(anchor="w", padx=5, pady=2)
 
-        self.result_tree = ttk.Treeview(result_frame, columns=("PID", "Start", "End", "Waiting", "Turnaround"), show="headings", height=10, style="Treeview")
-        for col in ("PID", "Start", "End", "Waiting", "Turnaround"):
-            self.result_tree.heading(col, text=col)
-            self.result_tree.column(col, width=120, anchor="center")
-        self.result_tree.pack(fill="both", expand=True, padx=5, pady=2)
+        self.result_model.refresh()
+        self.result_view = VirtualTable(result_frame, self.result_model, height=10)
+        self.result_view.pack(fill="both", expand=True, padx=5, pady=2)
 
-    def display_results(self, processes, algo_name, avg_wait, avg_turn, cpu_util, throughput):
+    def display_metrics(self, algo_name, avg_wait, avg_turn, cpu_util, throughput):
         if not hasattr(self, 'algo_label'):
             self.show_results()
         self.algo_label.config(text=f"Algorithm: {algo_name}")
@@ -588,11 +758,20 @@ class SchedulerGUI:
         self.turn_label.config(text=f"Avg Turnaround Time: {avg_turn:.2f}")
         self.cpu_label.config(text=f"CPU Utilization: {cpu_util:.2f}%")
         self.throughput_label.config(text=f"Throughput: {throughput:.4f}")
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
-        for p in processes:
-            start = p.start_time if p.start_time is not None else "N/A"
-            self.result_tree.insert("", "end", values=(p.pid, start, p.end_time, p.waiting_time, p.turnaround_time))
+
+    @staticmethod
+    def _result_row(p):
+        return p.pid, p.start_time, p.end_time, p.waiting_time, p.turnaround_time
+
+    def insert_result_row(self, p):
+        # Step mode: follow the newest finished process.
+        self.result_rows.append(p)
+        self.result_view.row_added(len(self.result_rows) - 1, follow=self.result_model.order is None)
+
+    def display_results(self, processes, algo_name, avg_wait, avg_turn, cpu_util, throughput):
+        self.display_metrics(algo_name, avg_wait, avg_turn, cpu_util, throughput)
+        self.result_rows = list(processes)
+        self.result_view.refresh()
         self.status_var.set("Results updated")
 
     def view_gantt(self):
@@ -600,7 +779,7 @@ class SchedulerGUI:
             messagebox.showwarning("Warning", "No timeline available. Run a simulation first.", parent=self.root)
             self.status_var.set("No timeline available")
             return
-        print(f"Opening Gantt chart with timeline: {self.timeline}")
+        logging.info(f"Opening Gantt chart for {self.current_algo_name}: {len(self.timeline)} segments")
         visualizer = SchedulerVisualizer()
         visualizer.display_gantt_chart(self.current_algo_name, self.current_processes, self.timeline)
         self.status_var.set("Gantt chart opened")
@@ -612,62 +791,120 @@ class SchedulerGUI:
                 return
             self.add_random_processes()
 
-        if self.comparison_thread and self.comparison_thread.is_alive():
+        if self.service.busy("comparison"):
             self.status_var.set("Comparison already in progress...")
             return
 
-        self.status_var.set("Starting comparison...")
-        self.comparison_results.clear()
-        self.comparison_thread = threading.Thread(target=self._run_comparison_task, daemon=True)
-        self.comparison_thread.start()
-        self.root.after(100, self._check_comparison_completion)
-
-    def _run_comparison_task(self):
         try:
             quantum = int(self.quantum_var.get())
             self.num_cores = int(self.cores_var.get())
-            algorithms = ["FCFS", "SJF-NP", "SJF-P", "RR", "PR-NP", "PR-P", "MLFQ", "Intelligent"]
-            logging.info(f"Starting comparison with {len(self.processes)} processes, quantum={quantum}, cores={self.num_cores}")
-            for i, algo in enumerate(algorithms, 1):
-                logging.info(f"Starting {algo} at {time.time()}")
-                processes_copy = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in self.processes]
-                try:
-                    if algo == "Intelligent":
-                        predicted_algo = self.ai_scheduler.predict_best_algorithm(processes_copy)
-                        processes, algo_name, timeline = self.run_algorithm(predicted_algo, processes_copy, quantum)
-                        algo_name = f"Intelligent ({predicted_algo})"
-                    else:
-                        processes, algo_name, timeline = self.run_algorithm(algo, processes_copy, quantum)
-                    avg_wait, avg_turn, cpu_util, throughput = calculate_metrics(processes)
-                    self.comparison_results[algo_name] = {
-                        "processes": processes,
-                        "timeline": timeline,
-                        "avg_wait": avg_wait,
-                        "avg_turn": avg_turn,
-                        "cpu_util": cpu_util,
-                        "throughput": throughput
-                    }
-                    logging.info(f"Completed {algo_name}: Avg Wait={avg_wait:.2f}, Avg Turn={avg_turn:.2f}, CPU Util={cpu_util:.2f}%, Throughput={throughput:.4f} at {time.time()}")
-                    self.root.after(0, lambda: self.status_var.set(f"Processing {algo} ({i}/{len(algorithms)})"))
-                except Exception as e:
-                    logging.error(f"Error running {algo} at {time.time()}: {str(e)}")
-                logging.info(f"Finished {algo} at {time.time()}")
-            logging.info(f"Comparison results: {list(self.comparison_results.keys())}")
-            if not self.comparison_results:
-                logging.warning("No results generated in comparison. Check algorithm implementations.")
-        except Exception as e:
-            logging.error(f"General error in comparison at {time.time()}: {str(e)}")
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Comparison failed: {str(e)}", parent=self.root))
-
-    def _check_comparison_completion(self):
-        if self.comparison_thread and not self.comparison_thread.is_alive():
-            if self.comparison_results:
-                self.show_comparison()
-                self.status_var.set("Comparison completed")
-            else:
-                self.status_var.set("Comparison failed: No results generated")
+            quanta, boost_interval = self.mlfq_settings()
+        except ValueError as e:
+            messagebox.showerror("Error", f"Comparison failed: {str(e)}", parent=self.root)
+            self.status_var.set("Comparison failed")
+            return
+
+        self.status_var.set("Starting comparison...")
+        self.comparison_results.clear()
+        self.comparison_done = 0
+        self.service.submit("comparison", self._run_comparison_task, self.processes.copy(), quantum, self.num_cores,
+                            quanta, boost_interval,
+                            on_progress=self._comparison_progress, on_done=self._comparison_finished,
+                            on_error=self._comparison_failed, on_cancel=self._comparison_finished)
+
+    def _get_comparison_executor(self):
+        # Workers are spawned rather than forked so they never inherit Tk state,
+        # and the pool is kept around so later comparisons skip the startup cost.
+        if self.comparison_executor is None:
+            self.comparison_executor = ProcessPoolExecutor(max_workers=min(len(COMPARISON_ALGORITHMS), os.cpu_count() or 1),
+                                                           mp_context=multiprocessing.get_context("spawn"))
+        return self.comparison_executor
+
+    def _run_comparison_task(self, job, workload, quantum, num_cores, quanta=None, boost_interval=None):
+        logging.info(f"Starting comparison with {len(workload)} processes, quantum={quantum}, cores={num_cores}")
+        fingerprint = workload_fingerprint(workload)
+        futures = {}
+
+        def publish(algo, run_as, algo_name, result):
+            if algo == "Intelligent":
+                algo_name = f"Intelligent ({run_as})"
+            logging.info(f"Completed {algo_name}: Avg Wait={result['avg_wait']:.2f}, Avg Turn={result['avg_turn']:.2f}, CPU Util={result['cpu_util']:.2f}%, Throughput={result['throughput']:.4f} at {time.time()}")
+            job.report(algo, algo_name, result)
+
+        for algo in COMPARISON_ALGORITHMS:
+            job.check()
+            run_as = self.ai_scheduler.predict_best_algorithm(workload, quantum) if algo == "Intelligent" else algo
+            key = cache_key(fingerprint, run_as, quantum, num_cores, quanta, boost_interval)
+            cached = RESULT_CACHE.get(key)
+            if cached is not None:
+                logging.info(f"Using cached result for {algo}")
+                publish(algo, run_as, *summarize_run(*cached))
+                continue
+            # Each submit pickles the table's column buffers, so every worker
+            # gets its own copy of the workload. Workers skip their own
+            # caches; results are cached here, where later runs look.
+            logging.info(f"Submitting {algo} at {time.time()}")
+            future = self._get_comparison_executor().submit(simulate_algorithm, run_as, workload, quantum, num_cores, None,
+                                                              quanta, boost_interval)
+            futures[future] = (algo, run_as, key)
+        pending = set(futures)
+        try:
+            while pending:
+                # Wake up now and then to notice a cancellation even while
+                # every worker is still busy.
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                job.check()
+                for future in done:
+                    algo, run_as, key = futures[future]
+                    try:
+                        algo_name, result = future.result()
+                        RESULT_CACHE.put(key, (result["processes"], algo_name, result["timeline"]))
+                        publish(algo, run_as, algo_name, result)
+                    except Exception as e:
+                        logging.error(f"Error running {algo} at {time.time()}: {str(e)}")
+                        job.report(algo, None, None)
+        finally:
+            # On cancellation, runs not yet started are dropped; the pool
+            # itself is kept for the next comparison.
+            for future in futures:
+                future.cancel()
+
+    def _comparison_progress(self, algo, algo_name, result):
+        # Fills in the comparison table as each algorithm finishes.
+        self.comparison_done += 1
+        if result is None:
+            return
+        first = not self.comparison_results
+        self.comparison_results[algo_name] = result
+        self.comparison_order[algo_name] = COMPARISON_ALGORITHMS.index(algo)
+        if first:
+            self.show_comparison()
+        elif self.comparison_frame.winfo_ismapped() and hasattr(self, 'comp_view') and self.comp_view.winfo_exists():
+            self.comp_view.refresh()
+        self.status_var.set(f"Processing {algo} ({self.comparison_done}/{len(COMPARISON_ALGORITHMS)})")
+
+    def _comparison_finished(self, result=None):
+        # Also called on cancellation, keeping whatever finished by then.
+        complete = self.comparison_done == len(COMPARISON_ALGORITHMS)
+        self.comparison_done = 0
+        logging.info(f"Comparison results: {list(self.comparison_results.keys())}")
+        if self.comparison_results:
+            ordered = sorted(self.comparison_results.items(), key=lambda item: self.comparison_order[item[0]])
+            self.comparison_results.clear()
+            self.comparison_results.update(ordered)
+            self.show_comparison()
+            self.status_var.set("Comparison completed" if complete else "Comparison cancelled")
+        elif complete:
+            logging.warning("No results generated in comparison. Check algorithm implementations.")
+            self.status_var.set("Comparison failed: No results generated")
         else:
-            self.root.after(100, self._check_comparison_completion)
+            self.status_var.set("Comparison cancelled")
+
+    def _comparison_failed(self, error):
+        self.comparison_done = 0
+        logging.error(f"General error in comparison at {time.time()}: {str(error)}")
+        messagebox.showerror("Error", f"Comparison failed: {str(error)}", parent=self.root)
+        self.status_var.set("Comparison failed")
 
     def build_comparison(self):
         for widget in self.comparison_frame.winfo_children():
@@ -684,17 +921,14 @@ class SchedulerGUI:
 
         if not self.comparison_results:
             ttk.Label(comp_frame, text="Run comparison first or check console for errors.", style="Modern.TLabel").pack(pady=2)
+            self.build_sweep()
             return
 
         table_frame = ttk.Frame(comp_frame)
         table_frame.pack(fill="both", expand=True, padx=5, pady=0)
 
-        self.comp_tree = ttk.Treeview(table_frame, columns=("Algorithm", "Avg Wait", "Avg Turn", 
-                            "CPU Util", "Throughput"), show="headings", height=10, style="Treeview")
-        for col in ("Algorithm", "Avg Wait", "Avg Turn", "CPU Util", "Throughput"):
-            self.comp_tree.heading(col, text=col)
-            self.comp_tree.column(col, width=150, anchor="center")
-        self.comp_tree.pack(fill="both", expand=True, padx=5, pady=2)
+        self.comp_view = VirtualTable(table_frame, self.comparison_model, height=10, width=110, filter_box=False)
+        self.comp_view.pack(fill="both", expand=True, padx=5, pady=2)
 
         btn_frame = ttk.Frame(table_frame)
         btn_frame.pack(pady=2)
@@ -704,6 +938,133 @@ class SchedulerGUI:
         ttk.Button(btn_frame, text="View Chart", command=self.view_comparison_chart, style="Modern.TButton").pack(side="left", padx=2)
 
         self.display_comparison()
+        self.build_sweep()
+
+    def build_sweep(self):
+        sweep_frame = ttk.LabelFrame(self.comparison_frame, text="Parameter Sweep", padding=2, style="Modern.TFrame")
+        sweep_frame.pack(fill="both", expand=True, padx=5, pady=2)
+
+        controls = ttk.Frame(sweep_frame)
+        controls.pack(fill="x", pady=2)
+        fields = [("Quanta:", self.sweep_quanta_var, 10), ("Cores:", self.sweep_cores_var, 8),
+                  ("MLFQ Quanta (2/4/8; ...):", self.sweep_mlfq_var, 18)]
+        for i, (label, var, width) in enumerate(fields):
+            ttk.Label(controls, text=label, style="Modern.TLabel").grid(row=0, column=2 * i, padx=5, sticky="e")
+            ttk.Entry(controls, textvariable=var, width=width, style="TEntry").grid(row=0, column=2 * i + 1, padx=5)
+        ttk.Button(controls, text="Run Sweep", command=self.start_sweep, style="Compare.TButton").grid(row=0, column=6, padx=5)
+        ttk.Button(controls, text="Cancel", command=self.cancel_simulation, style="Modern.TButton").grid(row=0, column=7, padx=5)
+
+        if not self.sweep_rows:
+            ttk.Label(sweep_frame, text="Sweep quantum, MLFQ quanta and core count for every algorithm.", style="Modern.TLabel").pack(pady=2)
+            return
+
+        view_controls = ttk.Frame(sweep_frame)
+        view_controls.pack(fill="x", pady=2)
+        cores = sorted({row["cores"] for row in self.sweep_rows})
+        if int(self.sweep_core_choice.get() or 0) not in cores:
+            self.sweep_core_choice.set(str(cores[0]))
+        ttk.Label(view_controls, text="Metric:", style="Modern.TLabel").pack(side="left", padx=5)
+        metric_box = ttk.Combobox(view_controls, textvariable=self.sweep_metric_var, values=SWEEP_METRICS, state="readonly", width=12)
+        metric_box.pack(side="left", padx=5)
+        ttk.Label(view_controls, text="Cores:", style="Modern.TLabel").pack(side="left", padx=5)
+        core_box = ttk.Combobox(view_controls, textvariable=self.sweep_core_choice, values=cores, state="readonly", width=5)
+        core_box.pack(side="left", padx=5)
+        for box in (metric_box, core_box):
+            box.bind("<<ComboboxSelected>>", lambda e: self.display_sweep())
+
+        surface_frame = ttk.Frame(sweep_frame)
+        surface_frame.pack(fill="both", expand=True)
+        self.sweep_tree = ttk.Treeview(surface_frame, show="headings", height=8, style="Treeview")
+        self.sweep_tree.pack(side="left", fill="both", expand=True, padx=5, pady=2)
+        self.sweep_canvas = tk.Canvas(surface_frame, width=480, height=200, bg="#2E4057", highlightthickness=0)
+        self.sweep_canvas.pack(side="left", fill="both", padx=5, pady=2)
+        self.display_sweep()
+
+    def start_sweep(self):
+        if not self.processes:
+            if not messagebox.askyesno("Warning", "No processes added. Add random processes?", parent=self.root):
+                self.status_var.set("Sweep cancelled: No processes")
+                return
+            self.add_random_processes()
+
+        if self.service.busy("sweep"):
+            self.status_var.set("Sweep already in progress...")
+            return
+
+        try:
+            quanta = parse_int_list(self.sweep_quanta_var.get())
+            cores = parse_int_list(self.sweep_cores_var.get())
+            mlfq_quanta = parse_quanta_vectors(self.sweep_mlfq_var.get())
+        except ValueError as e:
+            messagebox.showerror("Error", f"Sweep failed: {str(e)}", parent=self.root)
+            self.status_var.set("Sweep failed")
+            return
+
+        self.status_var.set("Starting sweep...")
+        self.sweep_rows = []
+        self.service.submit("sweep", self._run_sweep_task, self.processes.copy(), quanta, cores, mlfq_quanta,
+                            on_progress=lambda done, total: self.status_var.set(f"Sweep {done}/{total}"),
+                            on_done=self._sweep_finished, on_error=self._sweep_failed,
+                            on_cancel=lambda: self.status_var.set("Sweep cancelled"))
+
+    def _run_sweep_task(self, job, workload, quanta, cores, mlfq_quanta):
+        logging.info(f"Starting sweep with {len(workload)} processes, quanta={quanta}, cores={cores}, mlfq={mlfq_quanta}")
+
+        def on_result(row, done, total):
+            job.check()
+            job.report(done, total)
+
+        return run_sweep(workload, COMPARISON_ALGORITHMS, quanta, cores, mlfq_quanta, on_result=on_result)
+
+    def _sweep_finished(self, rows):
+        self.sweep_rows = rows
+        self.show_comparison()
+        self.status_var.set(f"Sweep completed: {len(rows)} runs")
+
+    def _sweep_failed(self, error):
+        messagebox.showerror("Error", f"Sweep failed: {str(error)}", parent=self.root)
+        self.status_var.set("Sweep failed")
+
+    def display_sweep(self):
+        metric = self.sweep_metric_var.get()
+        variants, quanta, values = surface(self.sweep_rows, metric, int(self.sweep_core_choice.get()))
+        columns = quanta or [None]
+        headings = ["Algorithm"] + [f"q={q}" if q is not None else "-" for q in columns]
+        self.sweep_tree.configure(columns=headings)
+        for col in headings:
+            self.sweep_tree.heading(col, text=col)
+            self.sweep_tree.column(col, width=110 if col == "Algorithm" else 60, anchor="center")
+        for item in self.sweep_tree.get_children():
+            self.sweep_tree.delete(item)
+        for name in variants:
+            self.sweep_tree.insert("", "end", values=[name] + [f"{values[name][q]:.4g}" for q in columns])
+        self.draw_sweep_heatmap(variants, columns, values, metric)
+
+    def draw_sweep_heatmap(self, variants, columns, values, metric):
+        # Green is the best cell for the metric, red the worst.
+        canvas = self.sweep_canvas
+        canvas.delete("all")
+        cells = [values[name][q] for name in variants for q in columns]
+        if not cells:
+            return
+        low, high = min(cells), max(cells)
+        label_width = 110
+        cell_width = max(12, (int(canvas["width"]) - label_width) // len(columns))
+        cell_height = max(10, min(24, (int(canvas["height"]) - 20) // len(variants)))
+        for row, name in enumerate(variants):
+            y = row * cell_height
+            canvas.create_text(label_width - 5, y + cell_height / 2, text=name, anchor="e", fill="#E6E6FA", font=("Segoe UI", 8))
+            for col, q in enumerate(columns):
+                score = (values[name][q] - low) / (high - low) if high > low else 0.5
+                if metric in LOWER_IS_BETTER:
+                    score = 1 - score
+                red, green = (255, int(510 * score)) if score < 0.5 else (int(510 * (1 - score)), 255)
+                x = label_width + col * cell_width
+                canvas.create_rectangle(x, y, x + cell_width, y + cell_height, fill=f"#{red:02x}{green:02x}40", outline="#2E4057")
+        y = len(variants) * cell_height + 10
+        for col, q in enumerate(columns):
+            if q is not None:
+                canvas.create_text(label_width + (col + 0.5) * cell_width, y, text=str(q), fill="#E6E6FA", font=("Segoe UI", 8))
 
     def draw_bar_chart(self, tab, data, title, ylabel, colors):
         for widget in tab.winfo_children():
@@ -755,7 +1116,9 @@ class SchedulerGUI:
             canvas.create_text(x0 + bar_width // 2, text_y, text=f"{value:.2f}", font=("Segoe UI", 10, "bold"), fill="#E6E6FA")
             canvas.create_text(x0 + bar_width // 2 + 1, text_y + 1, text=f"{value:.2f}", font=("Segoe UI", 10, "bold"), fill="#B0B0FF")
 
-            algo_short = algo.split()[0] if " " in algo else algo[:4]
+            # The algorithm's code (PR-NP, PR-P-AGE, ...); the display names
+            # of the priority variants all start with "Priority".
+            algo_short = COMPARISON_ALGORITHMS[self.comparison_order[algo]]
             canvas.create_text(x0 + bar_width // 2, canvas_height - 100, text=algo_short, font=("Segoe UI", 10), angle=45, fill="#E6E6FA")
 
         canvas.create_line(50, canvas_height - 150, canvas_width - 50, canvas_height - 150, fill="#E6E6FA", width=2)
@@ -770,25 +1133,22 @@ class SchedulerGUI:
         logging.debug("Bar chart drawn successfully")
 
     def display_comparison(self):
-        for item in self.comp_tree.get_children():
-            self.comp_tree.delete(item)
-        
-        algorithms = list(self.comparison_results.keys())
-        if not algorithms:
+        self.comp_view.refresh()
+        if not self.comparison_results:
             self.status_var.set("No comparison results to display")
             return
-        
-        wait_times = [self.comparison_results[algo]["avg_wait"] for algo in algorithms]
-        turn_times = [self.comparison_results[algo]["avg_turn"] for algo in algorithms]
-        cpu_utils = [self.comparison_results[algo]["cpu_util"] for algo in algorithms]
-        throughputs = [self.comparison_results[algo]["throughput"] for algo in algorithms]
+        self.status_var.set(f"Comparison displayed with {len(self.comparison_results)} algorithms")
 
-        for algo, data in self.comparison_results.items():
-            self.comp_tree.insert("", "end", values=(algo, f"{data['avg_wait']:.2f}", 
-                            f"{data['avg_turn']:.2f}", f"{data['cpu_util']:.2f}%", 
-                            f"{data['throughput']:.4f}"))
+    def _comparison_row(self, i):
+        algo, data = list(self.comparison_results.items())[i]
+        return (algo, data["avg_wait"], data["avg_turn"], data["p99_wait"], data["p99_turn"],
+                data["cpu_util"], data["throughput"], data["fairness"])
 
-        self.status_var.set(f"Comparison displayed with {len(algorithms)} algorithms")
+    @staticmethod
+    def _format_comparison_row(row):
+        algo, avg_wait, avg_turn, p99_wait, p99_turn, cpu_util, throughput, fairness = row
+        return (algo, f"{avg_wait:.2f}", f"{avg_turn:.2f}", p99_wait, p99_turn,
+                f"{cpu_util:.2f}%", f"{throughput:.4f}", f"{fairness:.3f}")
 
     def view_comparison_chart(self):
         if not self.comparison_results:
@@ -809,7 +1169,7 @@ class SchedulerGUI:
         turn_times = [self.comparison_results[algo]["avg_turn"] for algo in algorithms]
         cpu_utils = [self.comparison_results[algo]["cpu_util"] for algo in algorithms]
         throughputs = [self.comparison_results[algo]["throughput"] for algo in algorithms]
-        colors = ["#4CAF50", "#2196F3", "#FF9800", "#F44336", "#9C27B0", "#3F51B5", "#FF5722", "#009688"]
+        colors = ["#4CAF50", "#2196F3", "#FF9800", "#F44336", "#9C27B0", "#3F51B5", "#FF5722", "#009688", "#CDDC39", "#795548"]
 
         wait_chart_tab = ttk.Frame(chart_notebook)
         turn_chart_tab = ttk.Frame(chart_notebook)
@@ -836,6 +1196,9 @@ class SchedulerGUI:
         metrics = {
             "Lowest Avg Waiting Time": lambda x: min(x, key=lambda k: self.comparison_results[k]["avg_wait"]),
             "Lowest Avg Turnaround Time": lambda x: min(x, key=lambda k: self.comparison_results[k]["avg_turn"]),
+            "Lowest P99 Waiting Time": lambda x: min(x, key=lambda k: self.comparison_results[k]["p99_wait"]),
+            "Lowest P99 Turnaround Time": lambda x: min(x, key=lambda k: self.comparison_results[k]["p99_turn"]),
+            "Highest Fairness": lambda x: max(x, key=lambda k: self.comparison_results[k]["fairness"]),
             "Highest CPU Utilization": lambda x: max(x, key=lambda k: self.comparison_results[k]["cpu_util"]),
             "Highest Throughput": lambda x: max(x, key=lambda k: self.comparison_results[k]["throughput"])
         }
@@ -843,7 +1206,7 @@ class SchedulerGUI:
         metric_var = tk.StringVar(value=list(metrics.keys())[0])
         dialog = tk.Toplevel(self.root)
         dialog.title("Select Best Metric")
-        dialog.geometry("320x200")
+        dialog.geometry("320x290")
         dialog.configure(bg="#1A2A44")
         
         ttk.Label(dialog, text="Choose metric to determine the best algorithm:", style="Modern.TLabel").pack(pady=5)
@@ -857,8 +1220,11 @@ class SchedulerGUI:
             message = (f"Best Algorithm: {best_algo}\n"
                       f"Avg Waiting Time: {best_values['avg_wait']:.2f}\n"
                       f"Avg Turnaround Time: {best_values['avg_turn']:.2f}\n"
+                      f"P99 Waiting Time: {best_values['p99_wait']}\n"
+                      f"P99 Turnaround Time: {best_values['p99_turn']}\n"
                       f"CPU Utilization: {best_values['cpu_util']:.2f}%\n"
-                      f"Throughput: {best_values['throughput']:.4f}")
+                      f"Throughput: {best_values['throughput']:.4f}\n"
+                      f"Fairness: {best_values['fairness']:.3f}")
             messagebox.showinfo("Best Algorithm", message, parent=self.root)
             dialog.destroy()
         
@@ -871,9 +1237,13 @@ class SchedulerGUI:
                                           filetypes=[("CSV files", "*.csv")])
         if file:
             with open(file, "w") as f:
-                f.write("Algorithm,Avg Wait,Avg Turn,CPU Util,Throughput\n")
+                f.write("Algorithm,Avg Wait,Avg Turn,P50 Wait,P90 Wait,P99 Wait,Max Wait,"
+                        "P50 Turn,P90 Turn,P99 Turn,Max Turn,Avg Response,Avg Slowdown,Fairness,CPU Util,Throughput\n")
                 for algo, data in self.comparison_results.items():
                     f.write(f"{algo},{data['avg_wait']:.2f},{data['avg_turn']:.2f},"
+                           f"{data['p50_wait']},{data['p90_wait']},{data['p99_wait']},{data['max_wait']},"
+                           f"{data['p50_turn']},{data['p90_turn']},{data['p99_turn']},{data['max_turn']},"
+                           f"{data['avg_response']:.2f},{data['avg_slowdown']:.2f},{data['fairness']:.3f},"
                            f"{data['cpu_util']:.2f},{data['throughput']:.4f}\n")
             self.status_var.set(f"Comparison exported to {file}")
 
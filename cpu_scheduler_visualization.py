@@ -1,5 +1,23 @@
 import tkinter as tk
 import random
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import itemgetter, le
+from timeline_store import Timeline
+
+LEGEND_LIMIT = 20       # legend entries shown before "+N more"
+MIN_TICK_SPACING = 60   # pixels between time markers
+MIN_SEGMENT_WIDTH = 2   # below this average width per segment, draw per pixel column
+MAX_SCALE = 400         # pixels per time unit when fully zoomed in
+LANE_HEIGHT = 60        # height of a core's swimlane, shrunk down to
+MIN_LANE_HEIGHT = 3     # this when many cores have to share the canvas
+AXIS_HEIGHT = 45
+ZOOM_STEP = 1.25
+FRAME_MS = 33           # frame clock period (about 30 fps)
+SPEEDS = [m * 10 ** e for e in range(7) for m in (1, 2, 5)]  # time units per second
+DEFAULT_PLAY_SECONDS = 10
 
 class SchedulerVisualizer:
     def __init__(self):
@@ -7,15 +25,14 @@ class SchedulerVisualizer:
         self.root.title("Gantt Chart - CPU Scheduler Simulator")
         self.root.geometry("1000x500")
         self.is_playing = False
-        self.current_index = 0
-        self.animation_speed = 500  # milliseconds
-        self.after_ids = []
+        self.frame_id = None
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def on_closing(self):
-        for after_id in self.after_ids:
-            self.root.after_cancel(after_id)
+        if self.frame_id is not None:
+            self.root.after_cancel(self.frame_id)
+            self.frame_id = None
         self.root.destroy()
 
     def display_gantt_chart(self, algo_name, processes, timeline):
@@ -24,24 +41,33 @@ class SchedulerVisualizer:
 
         tk.Label(frame, text=f"Gantt Chart - Algorithm: {algo_name}", font=("Arial", 16)).pack(anchor="w", pady=10)
 
-        # Legend
+        # Legend (colours for the rest are assigned as segments come into view)
         legend_frame = tk.Frame(frame)
         legend_frame.pack(fill="x", pady=10)
         tk.Label(legend_frame, text="Legend:", font=("Arial", 12)).pack(side="left")
-        self.process_colors = {p.pid: f"#{random.randint(0, 0xFFFFFF):06x}" for p in processes}
-        for pid, color in self.process_colors.items():
-            tk.Label(legend_frame, text=pid, bg=color, relief="solid", width=5).pack(side="left", padx=5)
-            tk.Label(legend_frame, text=f" {pid} ").pack(side="left")
+        self.process_colors = {}
+        for p in processes[:LEGEND_LIMIT]:
+            color = self.color_for(p.pid)
+            tk.Label(legend_frame, text=p.pid, bg=color, relief="solid", width=5).pack(side="left", padx=5)
+            tk.Label(legend_frame, text=f" {p.pid} ").pack(side="left")
+        if len(processes) > LEGEND_LIMIT:
+            tk.Label(legend_frame, text=f"+{len(processes) - LEGEND_LIMIT} more").pack(side="left")
 
-        # Canvas for Gantt chart
+        # Canvas for Gantt chart. Nothing is laid out at full length: the
+        # canvas only ever holds the items for the visible time window, which
+        # is redrawn whenever the view moves.
+        self.timeline = self.prepare_timeline(timeline)
+        self.lanes = self.timeline.by_core()
+        canvas_height = max(150, min(20 * len(self.lanes), 500) + AXIS_HEIGHT + 20)
+        if canvas_height > 150:
+            self.root.geometry(f"1000x{canvas_height + 350}")
         canvas_frame = tk.Frame(frame)
         canvas_frame.pack(fill="both", expand=True)
-        self.canvas = tk.Canvas(canvas_frame, height=150, highlightthickness=0)
+        self.canvas = tk.Canvas(canvas_frame, height=canvas_height, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True, pady=10)
 
-        scrollbar = tk.Scrollbar(canvas_frame, orient="horizontal", command=self.canvas.xview)
-        scrollbar.pack(side="bottom", fill="x")
-        self.canvas.configure(xscrollcommand=scrollbar.set)
+        self.scrollbar = tk.Scrollbar(canvas_frame, orient="horizontal", command=self.on_scroll)
+        self.scrollbar.pack(side="bottom", fill="x")
 
         # Control buttons
         control_frame = tk.Frame(frame)
@@ -49,85 +75,257 @@ class SchedulerVisualizer:
         self.play_pause_btn = tk.Button(control_frame, text="Play", command=self.toggle_animation)
         self.play_pause_btn.pack(side="left", padx=10)
         tk.Button(control_frame, text="Restart", command=self.restart_animation).pack(side="left", padx=10)
+        tk.Button(control_frame, text="Zoom In", command=lambda: self.zoom(ZOOM_STEP)).pack(side="left", padx=10)
+        tk.Button(control_frame, text="Zoom Out", command=lambda: self.zoom(1 / ZOOM_STEP)).pack(side="left", padx=10)
+        tk.Button(control_frame, text="Fit", command=self.zoom_to_fit).pack(side="left", padx=10)
+        tk.Label(control_frame, text="Speed (time units/s):").pack(side="left", padx=(20, 5))
+        self.speed_var = tk.StringVar(self.root)
+        tk.Spinbox(control_frame, values=[str(speed) for speed in SPEEDS], textvariable=self.speed_var,
+                   width=8).pack(side="left")
+
+        self.canvas.bind("<Configure>", lambda e: self.render())
+        self.canvas.bind("<MouseWheel>", self.on_wheel)
+        for button, direction in (("4", 1), ("5", -1)):
+            self.canvas.bind(f"<Button-{button}>", lambda e, d=direction: self.on_wheel(e, d))
+        self.canvas.bind("<ButtonPress-1>", self.on_drag_start)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
 
-        # Initialize animation data
-        self.timeline = timeline
-        print(f"Timeline: {self.timeline}")  # Debug timeline
-        self.total_time = max(end for _, _, end in timeline) if timeline else 1
-        canvas_width = max(1000, self.total_time * 50)
-        self.canvas.configure(scrollregion=(0, 0, canvas_width, 150))
-        self.unit_width = canvas_width / self.total_time
-        self.y_top = 40
-        self.y_bottom = 100
-
-        # Draw time markers
-        for t in range(self.total_time + 1):
-            x = t * self.unit_width
-            self.canvas.create_line(x, self.y_bottom, x, self.y_bottom + 10)
-            self.canvas.create_text(x, self.y_bottom + 25, text=str(t), anchor="n", font=("Arial", 8))
+        # Initialize animation data. One swimlane per core; within a lane,
+        # everything before bisect_right(reach, t) has finished by time t
+        # (reach is the running maximum of the segment ends).
+        self.total_time = self.timeline.end_time or 1
+        self.lane_reach = [array("q", accumulate(lane.ends, max)) for lane in self.lanes]
+        self.scale = 1000 / self.total_time if self.total_time * 50 < 1000 else 50  # pixels per time unit
+        self.view_start = 0.0
+        self.reveal_time = 0.0  # animation cursor: only time before it is drawn
+        self.last_frame = 0.0
+        default_speed = next((speed for speed in SPEEDS if speed * DEFAULT_PLAY_SECONDS >= self.total_time), SPEEDS[-1])
+        self.speed_var.set(str(default_speed))
+        self.drag_x = 0
+        self.y_top = 20
+        self.lane_height = LANE_HEIGHT
+        self.batch = []
 
         # Start animation
         if self.timeline:
-            self.is_playing = True
-            self.play_pause_btn.config(text="Pause")
-            self.animate_gantt()
-        else:
-            print("No timeline data to animate")
+            self.start_animation()
 
         self.root.mainloop()
 
+    @staticmethod
+    def prepare_timeline(timeline):
+        # The renderer looks segments up by start time, so it needs a
+        # Timeline ordered by start (custom schedulers may return any list).
+        if not isinstance(timeline, Timeline):
+            timeline = Timeline(timeline)
+        if not all(map(le, timeline.starts, timeline.starts[1:])):
+            timeline = Timeline(sorted(timeline.segments(), key=itemgetter(1)))
+        return timeline
+
+    def color_for(self, pid):
+        color = self.process_colors.get(pid)
+        if color is None:
+            color = self.process_colors[pid] = f"#{random.randint(0, 0xFFFFFF):06x}"
+        return color
+
+    # --- Viewport ---
+
+    def visible_width(self):
+        return max(self.canvas.winfo_width(), 1)
+
+    def clamp_scale(self, scale):
+        # Never zoom out further than the whole timeline fitting the window.
+        return min(max(scale, self.visible_width() / self.total_time), MAX_SCALE)
+
+    def set_view(self, view_start, scale=None):
+        if scale is not None:
+            self.scale = self.clamp_scale(scale)
+        span = self.visible_width() / self.scale
+        self.view_start = min(max(view_start, 0.0), max(self.total_time - span, 0.0))
+        self.render()
+
+    def zoom(self, factor, anchor_x=None):
+        # Zooms about anchor_x (the mouse position), or the middle of the view.
+        if anchor_x is None:
+            anchor_x = self.visible_width() / 2
+        anchor_time = self.view_start + anchor_x / self.scale
+        scale = self.clamp_scale(self.scale * factor)
+        self.set_view(anchor_time - anchor_x / scale, scale)
+
+    def zoom_to_fit(self):
+        self.set_view(0.0, self.visible_width() / self.total_time)
+
+    def on_scroll(self, action, amount, unit=None):
+        span = self.visible_width() / self.scale
+        if action == "moveto":
+            self.set_view(float(amount) * self.total_time)
+        elif unit == "pages":
+            self.set_view(self.view_start + int(amount) * span * 0.9)
+        else:
+            self.set_view(self.view_start + int(amount) * span / 10)
+
+    def on_wheel(self, event, direction=None):
+        if direction is None:
+            direction = 1 if event.delta > 0 else -1
+        if event.state & 0x4:  # Control held: zoom
+            self.zoom(ZOOM_STEP if direction > 0 else 1 / ZOOM_STEP, event.x)
+        else:
+            self.set_view(self.view_start - direction * self.visible_width() / self.scale / 10)
+
+    def on_drag_start(self, event):
+        self.drag_x = event.x
+
+    def on_drag(self, event):
+        dx, self.drag_x = event.x - self.drag_x, event.x
+        self.set_view(self.view_start - dx / self.scale)
+
+    # --- Rendering ---
+
+    def render(self):
+        canvas = self.canvas
+        canvas.delete("all")
+        width = self.visible_width()
+        lanes = len(self.lanes)
+        available = max(canvas.winfo_height(), 150) - self.y_top - AXIS_HEIGHT
+        self.lane_height = min(LANE_HEIGHT, max(available / lanes, MIN_LANE_HEIGHT))
+        y_bottom = self.y_top + lanes * self.lane_height
+        t0 = self.view_start
+        t1 = t0 + width / self.scale
+        self.scrollbar.set(t0 / self.total_time, min(t1 / self.total_time, 1.0))
+        self.draw_ticks(t0, t1, y_bottom)
+
+        # Segments overlapping [t0, t1) that the animation has reached. The
+        # rectangles are queued and created with one Tcl call per frame.
+        t1 = min(t1, self.reveal_time)
+        if t1 > t0:
+            for core, lane in enumerate(self.lanes):
+                y = self.y_top + core * self.lane_height
+                lo = bisect_right(self.lane_reach[core], t0)
+                hi = bisect_left(lane.starts, t1, lo)
+                if hi - lo > (t1 - t0) * self.scale / MIN_SEGMENT_WIDTH:
+                    self.draw_aggregated(lane, self.lane_reach[core], t0, t1, lo, hi, y)
+                else:
+                    self.draw_segments(lane, t0, t1, lo, hi, y)
+            self.flush()
+        if lanes > 1 and self.lane_height >= 10:
+            for core in range(lanes):
+                canvas.create_text(2, self.y_top + (core + 0.5) * self.lane_height, text=f"Core {core}",
+                                   anchor="w", font=("Arial", 8))
+        if self.reveal_time < self.total_time:
+            x = (self.reveal_time - t0) * self.scale
+            canvas.create_line(x, self.y_top - 10, x, y_bottom + 10, fill="red", width=2)
+
+    def draw_ticks(self, t0, t1, y_bottom):
+        # Tick spacing is the smallest 1-2-5 step that keeps labels apart.
+        step = 1
+        while step * self.scale < MIN_TICK_SPACING:
+            for multiple in (2, 5, 10):
+                if step * multiple * self.scale >= MIN_TICK_SPACING or multiple == 10:
+                    step *= multiple
+                    break
+        t = int(t0 // step) * step
+        while t <= t1:
+            x = (t - t0) * self.scale
+            self.canvas.create_line(x, y_bottom, x, y_bottom + 10)
+            self.canvas.create_text(x, y_bottom + 25, text=str(t), anchor="n", font=("Arial", 8))
+            t += step
+
+    def queue_rectangle(self, x0, y0, x1, y1, fill, outline="black"):
+        self.batch.append(f"{self.canvas} create rectangle {x0:.1f} {y0:.1f} {x1:.1f} {y1:.1f} "
+                          f"-fill {fill} -outline {outline}")
+
+    def flush(self):
+        if self.batch:
+            self.canvas.tk.eval("\n".join(self.batch))
+            self.batch = []
+
+    def draw_block(self, pid, start, end, t0, y):
+        x_start = (start - t0) * self.scale
+        x_end = (end - t0) * self.scale
+        self.queue_rectangle(x_start, y, x_end, y + self.lane_height, self.color_for(pid))
+        if x_end - x_start > 7 * len(pid) and self.lane_height >= 14:
+            self.canvas.create_text((x_start + x_end) / 2, y + self.lane_height / 2, text=pid, font=("Arial", 10))
+
+    def draw_segments(self, lane, t0, t1, lo, hi, y):
+        for i in range(lo, hi):
+            pid, start, end = lane[i]
+            if end > t0:
+                self.draw_block(pid, max(start, t0 - 1), min(end, t1), t0, y)
+
+    def draw_aggregated(self, lane, reach, t0, t1, lo, hi, y):
+        # Too many segments to tell apart: sample the segment under each
+        # pixel column and merge runs of columns that show the same process,
+        # so the item count is bounded by the window width.
+        starts, ends, pids, pid_index = lane.starts, lane.ends, lane.pids, lane.pid_index
+        width = int((t1 - t0) * self.scale)
+        y_end = y + self.lane_height
+        run_pid, run_x = None, 0
+        for x in range(width + 1):
+            pid = None
+            if x < width:
+                t = t0 + (x + 0.5) / self.scale
+                i = bisect_right(starts, t, lo, hi) - 1
+                if i >= lo and reach[i] > t:
+                    pid = pids[pid_index[i]] if ends[i] > t else ""
+            if pid != run_pid:
+                if run_pid is not None:
+                    color = self.color_for(run_pid) if run_pid else "#999999"
+                    self.queue_rectangle(run_x, y, x, y_end, color, color)
+                run_pid, run_x = pid, x
+
+    # --- Animation ---
+    # A frame clock: every frame advances the cursor by the wall time since
+    # the previous frame times the chosen speed, and redraws the visible
+    # window. A frame costs the same however many segments it passes over,
+    # so playback takes total_time / speed seconds for any timeline length.
+
+    def speed(self):
+        try:
+            return max(float(self.speed_var.get()), 0.0)
+        except ValueError:
+            return 1.0
+
+    def start_animation(self):
+        if self.reveal_time >= self.total_time:
+            self.reveal_time = 0.0
+            self.view_start = 0.0
+        self.is_playing = True
+        self.play_pause_btn.config(text="Pause")
+        self.last_frame = time.perf_counter()
+        if self.frame_id is None:
+            self.frame_id = self.root.after(0, self.animate_gantt)
+
+    def stop_animation(self):
+        self.is_playing = False
+        self.play_pause_btn.config(text="Play")
+        if self.frame_id is not None:
+            self.root.after_cancel(self.frame_id)
+            self.frame_id = None
+
     def toggle_animation(self):
-        self.is_playing = not self.is_playing
-        self.play_pause_btn.config(text="Pause" if self.is_playing else "Play")
         if self.is_playing:
-            self.animate_gantt()
+            self.stop_animation()
+        else:
+            self.start_animation()
 
     def restart_animation(self):
-        self.current_index = 0
-        self.canvas.delete("all")
-        self.is_playing = True
-        self.play_pause_btn.config(text="Pause")
-        self.animate_gantt()
+        self.stop_animation()
+        self.reveal_time = 0.0
+        self.view_start = 0.0
+        self.start_animation()
 
     def animate_gantt(self):
-        if not self.is_playing or self.current_index >= len(self.timeline):
-            self.is_playing = False
-            self.play_pause_btn.config(text="Play")
-            self.current_index = 0
-            print("Animation completed or paused")
-            return
-
-        if not self.root.winfo_exists():
-            print("Window closed, stopping animation")
+        self.frame_id = None
+        now = time.perf_counter()
+        self.reveal_time = min(self.reveal_time + (now - self.last_frame) * self.speed(), self.total_time)
+        self.last_frame = now
+        # Keep the cursor on screen by paging the view forward.
+        span = self.visible_width() / self.scale
+        if self.reveal_time > self.view_start + span:
+            self.view_start = min(self.reveal_time - span * 0.1, max(self.total_time - span, 0.0))
+        self.render()
+        if self.reveal_time >= self.total_time:
+            self.stop_animation()
             return
-
-        pid, start, end = self.timeline[self.current_index]
-        x_start = start * self.unit_width
-        x_end = end * self.unit_width
-        print(f"Animating {pid}: {start} to {end}")  # Debug animation step
-        block = self.canvas.create_rectangle(x_start, self.y_top, x_start, self.y_bottom, 
-                                           fill=self.process_colors.get(pid.split()[0], "#00D4FF"))
-        text = self.canvas.create_text((x_start + x_end) / 2, (self.y_top + self.y_bottom) / 2, 
-                                     text=pid, font=("Arial", 10))
-
-        steps = 10  # Reduced steps for faster animation
-        step_size = (x_end - x_start) / steps
-
-        def grow(step=0):
-            if not self.root.winfo_exists():
-                print("Window closed during animation")
-                return
-            if step >= steps or not self.is_playing:
-                self.canvas.coords(block, x_start, self.y_top, x_end, self.y_bottom)
-                self.current_index += 1
-                after_id = self.root.after(self.animation_speed, self.animate_gantt)
-                self.after_ids.append(after_id)
-                return
-            new_x_end = x_start + step_size * (step + 1)
-            self.canvas.coords(block, x_start, self.y_top, new_x_end, self.y_bottom)
-            self.canvas.coords(text, (x_start + new_x_end) / 2, (self.y_top + self.y_bottom) / 2)
-            after_id = self.root.after(50, grow, step + 1)  # Faster growth
-            self.after_ids.append(after_id)
-
-        after_id = self.root.after(0, grow)
-        self.after_ids.append(after_id)
\ No newline at end of file
+        elapsed_ms = (time.perf_counter() - now) * 1000
+        self.frame_id = self.root.after(max(int(FRAME_MS - elapsed_ms), 1), self.animate_gantt)
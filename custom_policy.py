@@ -0,0 +1,229 @@
+# custom_policy.py
+# User-written scheduling policies. Instead of re-implementing the whole
+# simulation, a policy supplies a few hooks and the built-in event engine
+# (_smp_events, the same one the multi-core schedulers use) calls them:
+#
+#   rank(process, now)          lower runs first; computed when a process is
+#                               queued, ties go to whichever was queued first
+#   pick_next(ready, now)       or choose from the ready list (in queue order)
+#   on_arrival(process, now)    optional, when a process first joins the queue
+#   on_slice_end(process, now)  optional, when a slice ends unfinished
+#   time_slice(process, quantum) optional, how long the next slice may run
+#                               (default: until done or preempted)
+#   NAME, PREEMPTIVE            display name; whether a better rank preempts
+#
+# The engine is event-driven, so there is no per-tick hook: on_slice_end is
+# where a policy ages or demotes. A legacy custom_scheduler(processes,
+# quantum) returning (processes, name, timeline) still works.
+#
+# Source is compiled once and the code object cached by its SHA-256. Policies
+# run in a long-lived worker process with an address-space limit and a wall
+# clock timeout, so a policy that loops forever or allocates without bound
+# costs a worker restart rather than the GUI.
+import hashlib
+import multiprocessing
+import threading
+import time
+import traceback
+from array import array
+import cpu_scheduler_algorithms
+from cpu_scheduler_algorithms import SchedulingPolicy, _smp_events, collect_events
+from process_table import ProcessTable
+from timeline_store import Timeline
+
+try:
+    import resource
+except ImportError:   # not on Windows; the timeout still applies
+    resource = None
+
+DEFAULT_TIMEOUT = 30.0          # seconds per run
+DEFAULT_MEMORY = 2 << 30        # bytes of address space for the worker
+CODE_CACHE_SIZE = 64
+
+POLICY_TEMPLATE = '''# Lower rank runs first. Optional hooks: pick_next(ready, now),
+# on_arrival(process, now), on_slice_end(process, now), time_slice(process, quantum).
+NAME = "Shortest Remaining"
+PREEMPTIVE = True
+
+def rank(process, now):
+    return process.remaining_time
+'''
+
+class PolicyError(Exception):
+    pass
+
+_code_cache = {}
+
+def compile_policy(source):
+    # (digest, code object); raises PolicyError on a syntax error.
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    code = _code_cache.get(digest)
+    if code is None:
+        try:
+            code = compile(source, f"<custom policy {digest[:8]}>", "exec")
+        except SyntaxError as e:
+            raise PolicyError(f"Syntax error on line {e.lineno}: {e.msg}") from None
+        if len(_code_cache) >= CODE_CACHE_SIZE:
+            del _code_cache[next(iter(_code_cache))]
+        _code_cache[digest] = code
+    return digest, code
+
+class CustomPolicy(SchedulingPolicy):
+    # Maps a policy's hooks onto the engine's SchedulingPolicy interface.
+    def __init__(self, hooks, quantum):
+        super().__init__()
+        self.name = str(hooks.get("NAME", "Custom"))
+        self.quantum = quantum
+        self.rank_hook = hooks.get("rank")
+        self.pick_next = hooks.get("pick_next")
+        self.arrival_hook = hooks.get("on_arrival")
+        self.slice_end_hook = hooks.get("on_slice_end")
+        self.slice_hook = hooks.get("time_slice")
+        self.preemptive = bool(hooks.get("PREEMPTIVE", False)) and self.pick_next is None
+        self.now = 0
+
+    def rank(self, process):
+        return self.rank_hook(process, self.now)
+
+    def push(self, process, current_time):
+        self.now = current_time
+        if self.arrival_hook and process.start_time is None:
+            self.arrival_hook(process, current_time)
+        if self.pick_next:
+            self.ready.append(process)
+        else:
+            super().push(process, current_time)
+
+    def pop(self, current_time):
+        self.now = current_time
+        if not self.pick_next:
+            return super().pop(current_time)
+        process = self.pick_next(self.ready, current_time)
+        for i, candidate in enumerate(self.ready):
+            if candidate is process:
+                # Kept in queue order, so min() and friends break ties FIFO.
+                del self.ready[i]
+                return process
+        raise PolicyError(f"pick_next returned {process!r}, which is not a ready process")
+
+    def should_preempt(self, running, current_time):
+        self.now = current_time
+        return super().should_preempt(running, current_time)
+
+    def time_slice(self, process):
+        if not self.slice_hook:
+            return process.remaining_time
+        return min(max(int(self.slice_hook(process, self.quantum)), 1), process.remaining_time)
+
+    def on_slice_end(self, process, current_time):
+        if self.slice_end_hook:
+            self.slice_end_hook(process, current_time)
+
+def _namespace():
+    # What the GUI's globals() used to offer custom code: the scheduler
+    # module's public names (Process, calculate_metrics, heapq, ...).
+    namespace = {name: value for name, value in vars(cpu_scheduler_algorithms).items() if not name.startswith("_")}
+    namespace["__name__"] = "custom_policy"
+    return namespace
+
+def execute_policy(source, table, quantum, num_cores=1):
+    # Runs a policy in this process: (table, completion order, name,
+    # timeline), where the order lists row indices of the finished table.
+    _, code = compile_policy(source)
+    hooks = _namespace()
+    exec(code, hooks)
+    if "rank" in hooks or "pick_next" in hooks:
+        policy = CustomPolicy(hooks, quantum)
+        table = table.sorted_by_arrival()
+        completed, timeline = collect_events(_smp_events(table.views(), num_cores, policy), num_cores)
+        name = policy.name if num_cores == 1 else f"{policy.name} (Multi-Core)"
+        return table, array("q", (p.index for p in completed)), name, timeline
+    legacy = hooks.get("custom_scheduler")
+    if legacy is None:
+        raise PolicyError("Define rank(process, now) or pick_next(ready, now) (or a legacy custom_scheduler)")
+    processes, name, timeline = legacy(table.views(), quantum)
+    processes = list(processes)
+    # Handed back as plain columns whatever the function returned.
+    result = ProcessTable.from_processes(processes, keep_state=True) if processes else ProcessTable()
+    if not isinstance(timeline, Timeline):
+        timeline = Timeline((pid, start, end) for pid, start, end, *_ in timeline)
+    return result, array("q", range(len(processes))), str(name), timeline
+
+def _serve(conn, memory_limit):
+    # Worker loop: one (source, table, quantum, num_cores) request at a
+    # time, answered with ("ok", result) or ("error", message).
+    if resource is not None and memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        try:
+            reply = ("ok", execute_policy(*request))
+        except PolicyError as e:
+            reply = ("error", str(e))
+        except MemoryError:
+            reply = ("error", f"Custom policy exceeded the {memory_limit / 2**20:.0f} MiB memory limit")
+        except Exception:
+            reply = ("error", traceback.format_exc(limit=-3))
+        conn.send(reply)
+
+class PolicySandbox:
+    def __init__(self, timeout=DEFAULT_TIMEOUT, memory_limit=DEFAULT_MEMORY):
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.process = None
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def _start(self):
+        # Spawned, not forked, so the worker never inherits Tk state.
+        context = multiprocessing.get_context("spawn")
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, self.memory_limit), daemon=True)
+        self.process.start()
+        child.close()
+
+    def stop(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.join()
+            self.conn.close()
+        self.process = self.conn = None
+
+    def run(self, source, processes, quantum, num_cores=1, check=None):
+        # Same result shape as run_algorithm. check() is called while
+        # waiting and may raise to abandon the run (the worker is killed).
+        compile_policy(source)   # report syntax errors without a round trip
+        table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+        with self.lock:
+            if self.process is None or not self.process.is_alive():
+                self._start()
+            deadline = time.monotonic() + self.timeout
+            try:
+                self.conn.send((source, table, quantum, num_cores))
+                while not self.conn.poll(0.1):
+                    if check:
+                        check()
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Custom policy did not finish within {self.timeout:g}s")
+                status, payload = self.conn.recv()
+            except TimeoutError:
+                self.stop()
+                raise
+            except (EOFError, OSError):
+                # The pipe closed or broke under us: the worker is gone (or
+                # going), typically after hitting the memory limit.
+                self.process.join(1)
+                code = self.process.exitcode
+                self.stop()
+                raise PolicyError(f"Custom policy worker died (exit code {code}); "
+                                  "it may have run out of memory") from None
+            except BaseException:
+                self.stop()
+                raise
+        if status == "error":
+            raise PolicyError(payload)
+        table, order, name, timeline = payload
+        return [table.view(i) for i in order], name, timeline
@@ -0,0 +1,134 @@
+# parameter_sweep.py
+# Grid search over quantum, MLFQ quanta vectors and core count for a single
+# workload. The workload is sorted by arrival once and handed to each pool
+# worker once (through the pool initializer); tasks only carry their
+# parameters and return a row of metrics.
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cpu_scheduler_algorithms import run_algorithm, calculate_extended_metrics
+from process_table import ProcessTable
+
+QUANTUM_ALGORITHMS = {"RR", "MLFQ", "Intelligent"}
+SWEEP_METRICS = ["avg_wait", "avg_turn", "p99_wait", "p99_turn", "cpu_util", "throughput", "fairness"]
+LOWER_IS_BETTER = {"avg_wait", "avg_turn", "p99_wait", "p99_turn"}
+
+def parse_int_list(text):
+    # "1-8", "2-20:2", "1,2,4,8" or any comma-separated mix of them.
+    values = []
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        step = 1
+        if ":" in part:
+            part, step = part.split(":", 1)
+            step = int(step)
+            if step <= 0:
+                raise ValueError(f"Invalid step in {text!r}: must be > 0")
+        if "-" in part:
+            low, high = part.split("-", 1)
+            values.extend(range(int(low), int(high) + 1, step))
+        else:
+            values.append(int(part))
+    if not values or any(v <= 0 for v in values):
+        raise ValueError(f"Invalid range {text!r}: expected positive integers such as 1-8, 2-20:2 or 1,2,4")
+    return sorted(set(values))
+
+def parse_quanta_vectors(text):
+    # "2/4/8; 4/8/16" -> [(2, 4, 8), (4, 8, 16)]
+    vectors = []
+    for part in text.replace(" ", "").split(";"):
+        if part:
+            vector = tuple(int(q) for q in part.split("/"))
+            if any(q <= 0 for q in vector):
+                raise ValueError(f"Invalid MLFQ quanta {part!r}: quanta must be > 0")
+            vectors.append(vector)
+    return vectors
+
+def sweep_grid(algorithms, quanta, cores, mlfq_quanta=()):
+    # (algo, quantum, mlfq quanta, cores) points. Algorithms that ignore the
+    # quantum get one point per core count; MLFQ is swept over the given
+    # quanta vectors, or over [q, 2q, 4q] for each quantum if there are none.
+    points = []
+    for algo in algorithms:
+        for num_cores in cores:
+            if algo == "MLFQ" and mlfq_quanta:
+                points.extend((algo, vector[0], tuple(vector), num_cores) for vector in mlfq_quanta)
+            elif algo in QUANTUM_ALGORITHMS:
+                points.extend((algo, quantum, None, num_cores) for quantum in quanta)
+            else:
+                points.append((algo, None, None, num_cores))
+    return points
+
+def variant_name(row):
+    if row["quanta"]:
+        return f"{row['algorithm']} {'/'.join(map(str, row['quanta']))}"
+    return row["algorithm"]
+
+_workload = None
+
+def _init_worker(workload):
+    global _workload
+    _workload = workload
+
+def _run_point(algo, quantum, quanta, num_cores):
+    processes, algo_name, _ = run_algorithm(algo, _workload.copy(), quantum or 1, num_cores, cache=None, quanta=quanta)
+    metrics = calculate_extended_metrics(processes)
+    row = {"algorithm": algo, "algo_name": algo_name, "quantum": quantum, "quanta": quanta, "cores": num_cores}
+    row.update((name, metrics[name]) for name in SWEEP_METRICS)
+    return row
+
+def run_sweep(processes, algorithms, quanta, cores, mlfq_quanta=(), jobs=None, on_result=None):
+    # Returns one row per grid point, in grid order. on_result(row, done,
+    # total) is called as each point finishes (from the calling thread);
+    # an exception it raises stops the sweep.
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes)
+    workload = processes.sorted_by_arrival()
+    points = sweep_grid(algorithms, quanta, cores, mlfq_quanta)
+    rows = [None] * len(points)
+    if jobs == 1 or len(points) <= 1:
+        _init_worker(workload)
+        for i, point in enumerate(points):
+            rows[i] = _run_point(*point)
+            if on_result:
+                on_result(rows[i], i + 1, len(points))
+        return rows
+    # Spawned, not forked, so it is safe to start from the GUI. Not a with
+    # block: leaving one waits for the points in flight, even on cancel.
+    executor = ProcessPoolExecutor(max_workers=jobs or min(len(points), os.cpu_count() or 1),
+                                   mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(workload,))
+    try:
+        futures = {executor.submit(_run_point, *point): i for i, point in enumerate(points)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            rows[i] = future.result()
+            if on_result:
+                on_result(rows[i], done, len(points))
+    except BaseException:
+        # An error, or on_result raising to cancel: return now, dropping
+        # the points not started yet; those in flight finish on their own.
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    return rows
+
+def surface(rows, metric, num_cores):
+    # Pivots the rows for one core count into (variants, quanta, values),
+    # where values[variant][quantum] is the metric. Variants that do not
+    # depend on the quantum repeat their value across the row.
+    rows = [row for row in rows if row["cores"] == num_cores]
+    quanta = sorted({row["quantum"] for row in rows if row["quantum"] is not None and not row["quanta"]})
+    variants = []
+    values = {}
+    for row in rows:
+        name = variant_name(row)
+        if name not in values:
+            variants.append(name)
+            values[name] = {}
+        if row["quantum"] is None or row["quanta"]:
+            values[name].update((q, row[metric]) for q in quanta or [None])
+        else:
+            values[name][row["quantum"]] = row[metric]
+    return variants, quanta, values
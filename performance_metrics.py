@@ -1,7 +1,7 @@
 # performance_metrics.py
 import tkinter as tk
 from tkinter import ttk
-from cpu_scheduler_algorithms import calculate_metrics
+from cpu_scheduler_algorithms import calculate_extended_metrics
 
 class PerformanceMetrics:
     def __init__(self, processes, frame):
@@ -10,7 +10,8 @@ class PerformanceMetrics:
             return
 
         # Calculate metrics
-        avg_wait, avg_turn, cpu_util, throughput = calculate_metrics(processes)
+        metrics = calculate_extended_metrics(processes)
+        avg_wait, avg_turn, cpu_util, throughput = metrics["avg_wait"], metrics["avg_turn"], metrics["cpu_util"], metrics["throughput"]
 
         # Create a frame for metrics display
         metrics_frame = ttk.LabelFrame(frame, text="Performance Metrics", padding=10)
@@ -20,4 +21,13 @@ class PerformanceMetrics:
         ttk.Label(metrics_frame, text=f"Average Waiting Time: {avg_wait:.2f}").pack(anchor="w", padx=10, pady=5)
         ttk.Label(metrics_frame, text=f"Average Turnaround Time: {avg_turn:.2f}").pack(anchor="w", padx=10, pady=5)
         ttk.Label(metrics_frame, text=f"CPU Utilization: {cpu_util:.2f}%").pack(anchor="w", padx=10, pady=5)
-        ttk.Label(metrics_frame, text=f"Throughput: {throughput:.4f}").pack(anchor="w", padx=10, pady=5)
\ No newline at end of file
+        ttk.Label(metrics_frame, text=f"Throughput: {throughput:.4f}").pack(anchor="w", padx=10, pady=5)
+
+        # Tail latency and fairness
+        tail_frame = ttk.LabelFrame(frame, text="Tail Latency & Fairness", padding=10)
+        tail_frame.pack(fill="both", expand=True, pady=10)
+        ttk.Label(tail_frame, text=f"Waiting Time p50/p90/p99/max: {metrics['p50_wait']} / {metrics['p90_wait']} / {metrics['p99_wait']} / {metrics['max_wait']}").pack(anchor="w", padx=10, pady=5)
+        ttk.Label(tail_frame, text=f"Turnaround Time p50/p90/p99/max: {metrics['p50_turn']} / {metrics['p90_turn']} / {metrics['p99_turn']} / {metrics['max_turn']}").pack(anchor="w", padx=10, pady=5)
+        ttk.Label(tail_frame, text=f"Response Time avg/p99/max: {metrics['avg_response']:.2f} / {metrics['p99_response']} / {metrics['max_response']}").pack(anchor="w", padx=10, pady=5)
+        ttk.Label(tail_frame, text=f"Slowdown avg/max: {metrics['avg_slowdown']:.2f} / {metrics['max_slowdown']:.2f}").pack(anchor="w", padx=10, pady=5)
+        ttk.Label(tail_frame, text=f"Jain's Fairness Index: {metrics['fairness']:.3f}").pack(anchor="w", padx=10, pady=5)
@@ -0,0 +1,195 @@
+# process_table.py
+# Struct-of-arrays storage for a workload: one typed array per attribute
+# instead of one object (and one __dict__) per process. Schedulers run on
+# ProcessView objects, which read and write the columns in place.
+from array import array
+
+NOT_SET = -1  # start/end of a process that has not started/finished yet
+
+class ProcessTable:
+    __slots__ = ("pids", "arrival", "burst", "priority", "original_priority", "remaining",
+                 "start", "end", "waiting", "turnaround", "last_scheduled")
+
+    def __init__(self, pids=(), arrival=(), burst=(), priority=()):
+        self.pids = list(pids)
+        self.arrival = array("q", arrival)
+        self.burst = array("q", burst)
+        self.priority = array("q", priority)
+        if not len(self.pids) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("pid, arrival, burst and priority columns must have the same length")
+        self.original_priority = array("q", self.priority)
+        self.remaining = array("q", self.burst)
+        self.start = array("q", [NOT_SET]) * len(self.pids)
+        self.end = array("q", [NOT_SET]) * len(self.pids)
+        self.waiting = array("q", [0]) * len(self.pids)
+        self.turnaround = array("q", [0]) * len(self.pids)
+        self.last_scheduled = array("q", [0]) * len(self.pids)
+
+    @classmethod
+    def from_processes(cls, processes, keep_state=False):
+        table = cls([p.pid for p in processes], [p.arrival_time for p in processes],
+                    [p.burst_time for p in processes], [p.priority for p in processes])
+        if keep_state:
+            table.original_priority = array("q", [p.original_priority for p in processes])
+            table.remaining = array("q", [p.remaining_time for p in processes])
+            table.start = array("q", [NOT_SET if p.start_time is None else p.start_time for p in processes])
+            table.end = array("q", [NOT_SET if p.end_time is None else p.end_time for p in processes])
+            table.waiting = array("q", [p.waiting_time for p in processes])
+            table.turnaround = array("q", [p.turnaround_time for p in processes])
+            table.last_scheduled = array("q", [p.last_scheduled for p in processes])
+        return table
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __iter__(self):
+        return iter(self.views())
+
+    def append(self, pid, arrival_time, burst_time, priority):
+        self.pids.append(pid)
+        self.arrival.append(arrival_time)
+        self.burst.append(burst_time)
+        self.priority.append(priority)
+        self.original_priority.append(priority)
+        self.remaining.append(burst_time)
+        self.start.append(NOT_SET)
+        self.end.append(NOT_SET)
+        self.waiting.append(0)
+        self.turnaround.append(0)
+        self.last_scheduled.append(0)
+
+    def clear(self):
+        for name in ProcessTable.__slots__:
+            del getattr(self, name)[:]
+
+    def copy(self):
+        # Every column is a flat buffer, so cloning is one memcpy per column.
+        table = ProcessTable.__new__(ProcessTable)
+        for name in ProcessTable.__slots__:
+            setattr(table, name, getattr(self, name)[:])
+        return table
+
+    def sorted_by_arrival(self):
+        # A copy with the rows in arrival order (stable, like the schedulers'
+        # own sort), so repeated runs on it find the list already sorted.
+        order = sorted(range(len(self.pids)), key=self.arrival.__getitem__)
+        table = ProcessTable.__new__(ProcessTable)
+        table.pids = [self.pids[i] for i in order]
+        for name in ProcessTable.__slots__[1:]:
+            column = getattr(self, name)
+            setattr(table, name, array(column.typecode, map(column.__getitem__, order)))
+        return table
+
+    def view(self, index):
+        return ProcessView(self, index)
+
+    def views(self):
+        return [ProcessView(self, i) for i in range(len(self.pids))]
+
+class ProcessView:
+    # Drop-in stand-in for Process: same attribute names, backed by a table row.
+    # The accessors are spelled out rather than generated because they sit on
+    # the schedulers' hot paths.
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __reduce__(self):
+        return ProcessView, (self.table, self.index)
+
+    @property
+    def pid(self):
+        return self.table.pids[self.index]
+
+    @property
+    def arrival_time(self):
+        return self.table.arrival[self.index]
+
+    @arrival_time.setter
+    def arrival_time(self, value):
+        self.table.arrival[self.index] = value
+
+    @property
+    def burst_time(self):
+        return self.table.burst[self.index]
+
+    @burst_time.setter
+    def burst_time(self, value):
+        self.table.burst[self.index] = value
+
+    @property
+    def priority(self):
+        return self.table.priority[self.index]
+
+    @priority.setter
+    def priority(self, value):
+        self.table.priority[self.index] = value
+
+    @property
+    def original_priority(self):
+        return self.table.original_priority[self.index]
+
+    @original_priority.setter
+    def original_priority(self, value):
+        self.table.original_priority[self.index] = value
+
+    @property
+    def remaining_time(self):
+        return self.table.remaining[self.index]
+
+    @remaining_time.setter
+    def remaining_time(self, value):
+        self.table.remaining[self.index] = value
+
+    @property
+    def start_time(self):
+        value = self.table.start[self.index]
+        return None if value == NOT_SET else value
+
+    @start_time.setter
+    def start_time(self, value):
+        self.table.start[self.index] = NOT_SET if value is None else value
+
+    @property
+    def end_time(self):
+        value = self.table.end[self.index]
+        return None if value == NOT_SET else value
+
+    @end_time.setter
+    def end_time(self, value):
+        self.table.end[self.index] = NOT_SET if value is None else value
+
+    @property
+    def waiting_time(self):
+        return self.table.waiting[self.index]
+
+    @waiting_time.setter
+    def waiting_time(self, value):
+        self.table.waiting[self.index] = value
+
+    @property
+    def turnaround_time(self):
+        return self.table.turnaround[self.index]
+
+    @turnaround_time.setter
+    def turnaround_time(self, value):
+        self.table.turnaround[self.index] = value
+
+    @property
+    def last_scheduled(self):
+        return self.table.last_scheduled[self.index]
+
+    @last_scheduled.setter
+    def last_scheduled(self, value):
+        self.table.last_scheduled[self.index] = value
+
+def clone_processes(processes):
+    # Views over one table are cloned with a single copy of the table;
+    # anything else is gathered into a new table first.
+    table = getattr(processes[0], "table", None) if processes else None
+    if table is not None and all(getattr(p, "table", None) is table for p in processes):
+        table = table.copy()
+        return [ProcessView(table, p.index) for p in processes]
+    return ProcessTable.from_processes(processes, keep_state=True).views()
@@ -0,0 +1,151 @@
+# result_cache.py
+# Memoizes scheduler runs. Results are keyed on a fingerprint of the
+# workload plus the run parameters, kept in an in-memory LRU and, when a
+# directory is given, also pickled to disk so they survive restarts.
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from process_table import ProcessTable
+
+# Part of every key and disk file name. Bump it whenever a scheduler's
+# output changes, so results from the old code are never served again.
+CACHE_VERSION = 1
+
+def workload_fingerprint(processes):
+    # SHA-256 over the pid, arrival, burst, priority and remaining-time
+    # columns: equal workloads hash equal however they were built.
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes, keep_state=True)
+    digest = hashlib.sha256()
+    digest.update("\0".join(map(str, processes.pids)).encode("utf-8"))
+    for column in (processes.arrival, processes.burst, processes.priority, processes.remaining):
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+def cache_key(fingerprint, algo, quantum, num_cores, quanta=None, boost_interval=None):
+    if algo == "MLFQ" and quanta is None:
+        quanta = (quantum, quantum * 2, quantum * 4)
+    return (CACHE_VERSION, fingerprint, algo, quantum, tuple(quanta) if quanta else None, num_cores, boost_interval)
+
+class ResultCache:
+    # Values are run_algorithm results, (completed, algo_name, timeline).
+    # The memory tier is bounded by weight (processes plus timeline
+    # segments held), not entry count, since one big workload can outweigh
+    # dozens of small ones. Safe to share between threads.
+    def __init__(self, max_weight=5_000_000, directory=None, max_files=256):
+        self.max_weight = max_weight
+        self.directory = directory
+        self.max_files = max_files
+        self.entries = OrderedDict()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _weight(value):
+        return len(value[0]) + len(value[2])
+
+    def _path(self, key):
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"v{CACHE_VERSION}-{digest}.pkl")
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+        value = self._load(key) if self.directory else None
+        with self.lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        # Stored as a snapshot: the processes a run returns are usually the
+        # caller's own objects, and rescheduling them must not rewrite the
+        # cached result.
+        completed, algo_name, timeline = value
+        table = ProcessTable.from_processes(completed, keep_state=True) if completed else ProcessTable()
+        value = (table.views(), algo_name, timeline)
+        self._remember(key, value)
+        if self.directory:
+            self._store(key, value)
+
+    def _remember(self, key, value):
+        weight = self._weight(value)
+        if weight > self.max_weight:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.weight -= self._weight(old)
+            self.entries[key] = value
+            self.weight += weight
+            while self.weight > self.max_weight:
+                _, evicted = self.entries.popitem(last=False)
+                self.weight -= self._weight(evicted)
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)  # the disk tier is pruned oldest-first
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or otherwise unreadable: drop it.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _store(self, key, value):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, path)
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pkl"):
+                continue
+            if not name.startswith(f"v{CACHE_VERSION}-"):
+                # Written under another version; never read again.
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+                continue
+            files.append(os.path.join(self.directory, name))
+        if len(files) > self.max_files:
+            files.sort(key=os.path.getmtime)
+            for old in files[:len(files) - self.max_files]:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.weight = 0
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+# Shared by run_algorithm. Set CPU_SCHEDULER_CACHE_DIR to keep results on
+# disk between sessions.
+RESULT_CACHE = ResultCache(directory=os.environ.get("CPU_SCHEDULER_CACHE_DIR") or None)
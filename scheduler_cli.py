@@ -0,0 +1,178 @@
+# scheduler_cli.py
+# Headless batch runner: no tkinter import, so it starts in milliseconds and
+# can be driven from scripts and nightly jobs.
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from cpu_scheduler_algorithms import ALGORITHM_NAMES, COMPARISON_ALGORITHMS, run_algorithm, calculate_extended_metrics
+from workload_io import load_table, simulate_trace
+from ai_scheduler import AIScheduler
+
+FIELDS = ["workload", "algorithm", "algo_name", "quantum", "cores", "processes",
+          "avg_wait", "avg_turn", "cpu_util", "throughput",
+          "p50_wait", "p90_wait", "p99_wait", "max_wait", "p50_turn", "p90_turn", "p99_turn", "max_turn",
+          "avg_response", "p99_response", "max_response", "avg_slowdown", "max_slowdown", "fairness", "elapsed", "timeline"]
+
+@lru_cache(maxsize=8)
+def _read_workload(path):
+    return load_table(path)
+
+def load_workload(path):
+    return _read_workload(path).copy()
+
+def timeline_path(directory, path, algo, quantum, num_cores):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(directory, f"{name}-{algo}-q{quantum}-c{num_cores}.tl")
+
+def run_scenario(path, algo, quantum, num_cores, timeline_dir=None, quanta=None, boost_interval=None):
+    processes = load_workload(path)
+    run_as = algo
+    if algo == "Intelligent":
+        run_as = AIScheduler().predict_best_algorithm(processes, quantum)
+    start = time.perf_counter()
+    # Every scenario is distinct, so there is nothing to gain from the cache.
+    completed, algo_name, timeline = run_algorithm(run_as, processes, quantum, num_cores, None, quanta, boost_interval)
+    elapsed = time.perf_counter() - start
+    if algo == "Intelligent":
+        algo_name = f"Intelligent ({run_as})"
+    row = {
+        "workload": path,
+        "algorithm": algo,
+        "algo_name": algo_name,
+        "quantum": quantum,
+        "cores": num_cores,
+        "processes": len(completed)
+    }
+    row.update(calculate_extended_metrics(completed))
+    row["elapsed"] = elapsed
+    if timeline_dir:
+        row["timeline"] = timeline_path(timeline_dir, path, algo, quantum, num_cores)
+        timeline.save(row["timeline"])
+    return row
+
+def run_stream_scenario(path, algo, quantum, num_cores, timeline_dir=None, quanta=None, boost_interval=None):
+    # Single-core, constant-memory run straight off the trace; only the
+    # running totals are available, so the tail statistics are left empty.
+    if num_cores != 1:
+        raise ValueError("--stream only supports a single core")
+    start = time.perf_counter()
+    metrics = simulate_trace(path, algo, quantum, quanta, boost_interval)
+    elapsed = time.perf_counter() - start
+    avg_wait, avg_turn, cpu_util, throughput = metrics.metrics()
+    return {
+        "workload": path,
+        "algorithm": algo,
+        "algo_name": ALGORITHM_NAMES[algo],
+        "quantum": quantum,
+        "cores": num_cores,
+        "processes": metrics.count,
+        "avg_wait": avg_wait,
+        "avg_turn": avg_turn,
+        "cpu_util": cpu_util,
+        "throughput": throughput,
+        "max_wait": metrics.max_wait,
+        "max_turn": metrics.max_turn,
+        "elapsed": elapsed
+    }
+
+def run_batch(workloads, algorithms, quanta, cores, jobs=None, stream=False, timeline_dir=None,
+              mlfq_quanta=None, boost_interval=None):
+    scenarios = [(path, algo, quantum, num_cores, timeline_dir, mlfq_quanta, boost_interval)
+                 for path in workloads for algo in algorithms for quantum in quanta for num_cores in cores]
+    runner = run_stream_scenario if stream else run_scenario
+    rows = [None] * len(scenarios)
+    if jobs == 1:
+        for i, scenario in enumerate(scenarios):
+            rows[i] = runner(*scenario)
+        return rows
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(runner, *scenario): i for i, scenario in enumerate(scenarios)}
+        for future in as_completed(futures):
+            rows[futures[future]] = future.result()
+    return rows
+
+def format_rows(rows, fmt):
+    if fmt == "json":
+        return json.dumps(rows, indent=2) + "\n"
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=FIELDS, restval="", lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+def quanta_vector(text):
+    # "2/4/8" -> [2, 4, 8]
+    try:
+        quanta = [int(q) for q in text.split("/")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid quanta {text!r}, expected e.g. 2/4/8") from None
+    if any(q <= 0 for q in quanta):
+        raise argparse.ArgumentTypeError(f"invalid quanta {text!r}: quanta must be > 0")
+    return quanta
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run CPU scheduling simulations without the GUI.")
+    parser.add_argument("workloads", nargs="+", help="process sets: .json (as written by Save Config), .jsonl, .csv or .trace")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=COMPARISON_ALGORITHMS,
+                        choices=COMPARISON_ALGORITHMS, metavar="ALGO",
+                        help=f"algorithms to run (default: all of {', '.join(COMPARISON_ALGORITHMS)})")
+    parser.add_argument("-q", "--quantum", nargs="+", type=int, default=[2], help="time quantum(s) (default: 2)")
+    parser.add_argument("-c", "--cores", nargs="+", type=int, default=[1], help="core count(s) (default: 1)")
+    parser.add_argument("--mlfq-quanta", type=quanta_vector, metavar="Q1/Q2/...",
+                        help="MLFQ per-level quanta, one level each (default: q/2q/4q)")
+    parser.add_argument("--boost", type=int, metavar="N",
+                        help="move every MLFQ process back to the top level every N time units (default: never)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-f", "--format", choices=["json", "csv"], help="output format (default: from --output, else json)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream each arrival-sorted trace through a single core in constant memory "
+                             "(averages and maxima only; not available for Intelligent)")
+    parser.add_argument("--save-timelines", metavar="DIR",
+                        help="save each run's Gantt timeline to DIR in binary form "
+                             "(compare two with: python timeline_store.py OLD NEW)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if any(q <= 0 for q in args.quantum) or any(c <= 0 for c in args.cores):
+        print("Error: quantum and cores must be > 0", file=sys.stderr)
+        return 2
+    if args.boost is not None and args.boost <= 0:
+        print("Error: --boost must be > 0", file=sys.stderr)
+        return 2
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if args.output and os.path.splitext(args.output)[1].lower() == ".csv" else "json"
+    if args.stream:
+        if args.cores != [1]:
+            print("Error: --stream runs on a single core", file=sys.stderr)
+            return 2
+        if "Intelligent" in args.algorithms:
+            if args.algorithms is not COMPARISON_ALGORITHMS:
+                print("Error: --stream does not support Intelligent", file=sys.stderr)
+                return 2
+            args.algorithms = [algo for algo in COMPARISON_ALGORITHMS if algo != "Intelligent"]
+        if args.save_timelines:
+            print("Error: --stream does not keep a timeline", file=sys.stderr)
+            return 2
+    if args.save_timelines:
+        os.makedirs(args.save_timelines, exist_ok=True)
+    rows = run_batch(args.workloads, args.algorithms, args.quantum, args.cores, args.jobs, args.stream, args.save_timelines,
+                     args.mlfq_quanta, args.boost)
+    text = format_rows(rows, fmt)
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# simulation_service.py
+# Background execution for the GUI. A task runs on a daemon thread and
+# talks to the Tk thread only through its job's message queue: progress
+# updates, then exactly one of done/error/cancelled. The service drains the
+# queues from a root.after poll, so every callback runs on the Tk thread and
+# the task itself never touches a widget.
+#
+# Cancellation is cooperative: cancel() sets a flag and the task raises
+# Cancelled at its next check(). simulate() checks every CHECK_EVERY events
+# and reports progress by simulated time at most every PROGRESS_INTERVAL
+# seconds, so neither costs anything noticeable per dispatch.
+import logging
+import queue
+import threading
+import time
+from ai_scheduler import AIScheduler
+from cpu_scheduler_algorithms import collect_events, step_schedule
+from instrumentation import INSTRUMENTATION
+from process_table import ProcessTable
+from result_cache import RESULT_CACHE, cache_key, workload_fingerprint
+
+CHECK_EVERY = 1024        # events between cancellation checks
+PROGRESS_INTERVAL = 0.1   # seconds between progress reports
+
+class Cancelled(Exception):
+    pass
+
+class SimulationJob:
+    def __init__(self, name, task, args, on_progress=None, on_done=None, on_error=None, on_cancel=None):
+        self.name = name
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(task, args), name=name, daemon=True)
+
+    def _run(self, task, args):
+        try:
+            result = task(self, *args)
+        except Cancelled:
+            self.messages.put(("cancelled", None))
+        except Exception as e:
+            logging.exception(f"{self.name} failed")
+            self.messages.put(("error", e))
+        else:
+            self.messages.put(("done", result))
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check(self):
+        if self.cancel_event.is_set():
+            raise Cancelled(self.name)
+
+    def report(self, *update):
+        self.messages.put(("progress", update))
+
+class SimulationService:
+    # schedule(ms, callback) is root.after in the GUI.
+    def __init__(self, schedule, interval=100):
+        self.schedule = schedule
+        self.interval = interval
+        self.jobs = []
+        self.polling = False
+
+    def submit(self, name, task, *args, on_progress=None, on_done=None, on_error=None, on_cancel=None):
+        # Runs task(job, *args) in the background; its return value goes to
+        # on_done, an exception to on_error, and job.report(...) arguments
+        # to on_progress.
+        job = SimulationJob(name, task, args, on_progress, on_done, on_error, on_cancel)
+        self.jobs.append(job)
+        job.thread.start()
+        if not self.polling:
+            self.polling = True
+            self.schedule(self.interval, self.poll)
+        return job
+
+    def busy(self, name=None):
+        # A job stays busy until its final message has been delivered.
+        return any(name is None or job.name == name for job in self.jobs)
+
+    def cancel(self, name=None):
+        for job in self.jobs:
+            if name is None or job.name == name:
+                job.cancel()
+
+    def poll(self):
+        for job in list(self.jobs):
+            self._deliver(job)
+        if self.jobs:
+            self.schedule(self.interval, self.poll)
+        else:
+            self.polling = False
+
+    def _deliver(self, job):
+        while True:
+            try:
+                kind, payload = job.messages.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "progress":
+                if job.on_progress and not job.cancelled:
+                    job.on_progress(*payload)
+                continue
+            self.jobs.remove(job)
+            if kind == "done" and job.on_done:
+                job.on_done(payload)
+            elif kind == "error" and job.on_error:
+                job.on_error(payload)
+            elif kind == "cancelled" and job.on_cancel:
+                job.on_cancel()
+            return
+
+def estimate_horizon(processes, num_cores=1):
+    # A lower bound on the makespan (the last arrival, or the first arrival
+    # plus the total work spread over the cores), which turns the simulated
+    # clock into a progress fraction.
+    if isinstance(processes, ProcessTable):
+        arrivals, total_burst = processes.arrival, sum(processes.burst)
+    else:
+        arrivals, total_burst = [p.arrival_time for p in processes], sum(p.burst_time for p in processes)
+    if not arrivals:
+        return 0
+    return max(max(arrivals), min(arrivals) + total_burst / num_cores)
+
+def track(job, events, horizon, total):
+    # Passes (process, start, end, finished, core) events through, checking
+    # for cancellation and reporting (clock, horizon, finished, total).
+    finished = 0
+    next_report = time.monotonic() + PROGRESS_INTERVAL
+    for count, event in enumerate(events, 1):
+        if event[3]:
+            finished += 1
+        if not count % CHECK_EVERY:
+            job.check()
+            now = time.monotonic()
+            if now >= next_report:
+                job.report(event[2], horizon, finished, total)
+                next_report = now + PROGRESS_INTERVAL
+        yield event
+
+def simulate(job, algo, processes, quantum, num_cores=1, cache=RESULT_CACHE, quanta=None, boost_interval=None):
+    # The background counterpart of run_algorithm: the same result, read
+    # from and stored in the same cache, but cancellable and reporting
+    # progress. Runs on (and may sort) the processes given.
+    run_as = AIScheduler().predict_best_algorithm(processes, quantum) if algo == "Intelligent" else algo
+    key = None
+    if cache is not None:
+        key = cache_key(workload_fingerprint(processes), run_as, quantum, num_cores, quanta, boost_interval)
+    result = cache.get(key) if key is not None else None
+    if result is None:
+        job.check()
+        horizon, total = estimate_horizon(processes, num_cores), len(processes)
+        with INSTRUMENTATION.span("simulate", algorithm=run_as, quantum=quantum, cores=num_cores, processes=total):
+            algo_name, events = step_schedule(run_as, processes, quantum, num_cores, quanta, boost_interval)
+            completed, timeline = collect_events(track(job, events, horizon, total), num_cores)
+        result = (completed, algo_name, timeline)
+        if key is not None:
+            cache.put(key, result)
+    if algo == "Intelligent":
+        return result[0], f"Intelligent ({run_as})", result[2]
+    return result
+
+def prepare_steps(job, algo, processes, quantum, num_cores=1, quanta=None, boost_interval=None):
+    # Step mode's setup (prediction, sorting) off the Tk thread; the
+    # returned event generator is then advanced one dispatch per step.
+    run_as = AIScheduler().predict_best_algorithm(processes, quantum) if algo == "Intelligent" else algo
+    algo_name, events = step_schedule(run_as, processes, quantum, num_cores, quanta, boost_interval)
+    if algo == "Intelligent":
+        algo_name = f"Intelligent ({run_as})"
+    return algo_name, events
@@ -0,0 +1,74 @@
+# test_cpu_scheduler_algorithms.py
+# The multi-core engine run on one core must give exactly the schedule of
+# the single-core scheduler for the same policy; custom policies only ever
+# run through the engine, so this is what makes them comparable with the
+# built-in algorithms. Aging must keep priorities meaningful: equal jobs
+# finish in priority order without degenerating into a tick-level round
+# robin, while a low-priority job still gets through a high-priority stream.
+import random
+import pytest
+from cpu_scheduler_algorithms import (AGING_INTERVAL, ALGORITHM_NAMES, Process, _policy_for, _smp_events, collect_events,
+                                      iter_schedule, run_algorithm)
+from result_cache import ResultCache
+
+def random_workload(rng):
+    return [Process(pid, rng.randint(0, 30), rng.randint(1, 12), rng.randint(0, 4)) for pid in range(rng.randint(1, 25))]
+
+def segments(events):
+    _, timeline = collect_events(events, 1)
+    return list(timeline.segments())
+
+@pytest.mark.parametrize("algo, quanta, boost_interval",
+                         [(algo, None, None) for algo in ALGORITHM_NAMES] + [("MLFQ", [1, 3], 7)])
+def test_one_core_engine_matches_single_core(algo, quanta, boost_interval):
+    rng = random.Random(algo)
+    for _ in range(300):
+        workload = sorted(random_workload(rng), key=lambda p: p.arrival_time)
+        quantum = rng.randint(1, 4)
+        single = iter_schedule(algo, [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in workload],
+                               quantum, quanta, boost_interval)
+        engine = _smp_events(workload, 1, _policy_for(algo, quantum, quanta, boost_interval))
+        assert segments((p, start, end, finished, 0) for p, start, end, finished in single) == segments(engine)
+
+def aging_run(processes, num_cores=1):
+    completed, _, timeline = run_algorithm("PR-P-AGE", processes, 2, num_cores, cache=None)
+    return sorted(completed, key=lambda p: p.end_time), timeline
+
+@pytest.mark.parametrize("num_cores", [1, 2])
+def test_aging_keeps_priority_order_and_bounds_switches(num_cores):
+    # Equal jobs finish in priority order, and each dispatch that aging
+    # forces lasts at least an interval rather than a tick or two.
+    jobs = [Process(f"P{priority}", 0, 1000, priority) for priority in range(5)]
+    completed, timeline = aging_run(jobs, num_cores)
+    assert [p.priority for p in completed] == list(range(5))
+    assert len(timeline) <= 5 * 1000 // AGING_INTERVAL + 5
+
+def test_aging_high_against_low_priority():
+    completed, timeline = aging_run([Process("HI", 0, 200, 0), Process("LO", 0, 200, 5)])
+    assert [p.pid for p in completed] == ["HI", "LO"]
+    assert len(timeline) <= 2 * 200 // AGING_INTERVAL
+
+def test_aging_serves_low_priority_under_a_stream():
+    # Plain preemptive priority leaves the low-priority job until the
+    # high-priority stream (2000 units of back-to-back work) is over.
+    def workload():
+        return [Process("LO", 0, 20, 5)] + [Process(f"H{i}", 2 * i, 2, 0) for i in range(1000)]
+    def low_end(algo):
+        completed, _, _ = run_algorithm(algo, workload(), 2, cache=None)
+        return next(p.end_time for p in completed if p.pid == "LO")
+    assert low_end("PR-P") == 2020
+    assert low_end("PR-P-AGE") < 1000
+
+def test_cached_result_survives_rescheduling_the_same_processes():
+    # A one-core run schedules the caller's own objects; the cache must not
+    # hand them back after the caller has run them through something else.
+    def workload():
+        return [Process(f"P{i}", i, 5 - i % 3, i % 4) for i in range(6)]
+    cache = ResultCache()
+    processes = workload()
+    completed, _, _ = run_algorithm("FCFS", processes, 2, cache=cache)
+    expected = [(p.pid, p.start_time, p.end_time, p.waiting_time) for p in completed]
+    run_algorithm("SJF-P", processes, 2, cache=None)
+    completed, _, _ = run_algorithm("FCFS", workload(), 2, cache=cache)
+    assert cache.hits == 1
+    assert [(p.pid, p.start_time, p.end_time, p.waiting_time) for p in completed] == expected
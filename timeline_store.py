@@ -0,0 +1,205 @@
+# timeline_store.py
+# Compact Gantt timeline: (pid, start, end) segments kept in typed arrays,
+# with pids interned into a small table and the core each segment ran on in
+# its own column. Adjacent segments of the same pid on the same core are
+# merged as they are appended (pass merge=False to keep them apart).
+# A Timeline behaves like the list of (pid, start, end) tuples the
+# schedulers used to return (len, iteration, indexing, slicing);
+# segments() also yields the core.
+import sys
+import struct
+import heapq
+from array import array
+from itertools import accumulate
+from operator import add, itemgetter, sub
+
+TIMELINE_MAGIC = b"CPUTL002"
+TIMELINE_MAGIC_V1 = b"CPUTL001"            # single-core files, no core column
+TIMELINE_HEADER = struct.Struct("<8sQQ")   # magic, pid count, segment count
+PID_LENGTH = struct.Struct("<H")
+COLUMN_TYPES = [("b", 1 << 7), ("h", 1 << 15), ("i", 1 << 31), ("q", 1 << 63)]
+
+class Timeline:
+    __slots__ = ("pids", "pid_index", "starts", "ends", "cores", "_lookup")
+
+    def __init__(self, segments=()):
+        self.pids = []
+        self._lookup = {}
+        self.pid_index = array("i")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.cores = array("h")
+        for segment in segments:
+            self.append(*segment)
+
+    @classmethod
+    def _from_arrays(cls, pids, pid_index, starts, ends, cores=None):
+        timeline = cls()
+        timeline.pids = list(pids)
+        timeline._lookup = {pid: i for i, pid in enumerate(timeline.pids)}
+        timeline.pid_index = pid_index
+        timeline.starts = starts
+        timeline.ends = ends
+        timeline.cores = array("h", bytes(2 * len(starts))) if cores is None else cores
+        return timeline
+
+    @classmethod
+    def merged(cls, timelines):
+        # Interleaves per-core timelines into one ordered by start time.
+        timeline = cls()
+        for pid, start, end, core in heapq.merge(*(t.segments() for t in timelines), key=itemgetter(1)):
+            timeline.append(pid, start, end, core, merge=False)
+        return timeline
+
+    def __reduce__(self):
+        return Timeline._from_arrays, (self.pids, self.pid_index, self.starts, self.ends, self.cores)
+
+    def append(self, pid, start, end, core=0, merge=True):
+        index = self._lookup.get(pid)
+        if index is None:
+            index = len(self.pids)
+            self.pids.append(pid)
+            self._lookup[pid] = index
+        last = len(self.starts) - 1
+        if (merge and last >= 0 and self.pid_index[last] == index and self.ends[last] == start
+                and self.cores[last] == core):
+            self.ends[last] = end
+            return
+        self.pid_index.append(index)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.cores.append(core)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        pids = self.pids
+        for index, start, end in zip(self.pid_index, self.starts, self.ends):
+            yield pids[index], start, end
+
+    def segments(self):
+        pids = self.pids
+        for index, start, end, core in zip(self.pid_index, self.starts, self.ends, self.cores):
+            yield pids[index], start, end, core
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Timeline._from_arrays(self.pids, self.pid_index[i], self.starts[i], self.ends[i], self.cores[i])
+        return self.pids[self.pid_index[i]], self.starts[i], self.ends[i]
+
+    def __eq__(self, other):
+        if isinstance(other, Timeline):
+            if self.pids == other.pids:
+                return (self.pid_index == other.pid_index and self.starts == other.starts
+                        and self.ends == other.ends and self.cores == other.cores)
+            return len(self) == len(other) and self.first_difference(other) is None
+        if isinstance(other, list):
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"<Timeline: {len(self)} segments, {len(self.pids)} pids, {self.num_cores} cores, ends at {self.end_time}>"
+
+    @property
+    def end_time(self):
+        return max(self.ends) if self.ends else 0
+
+    @property
+    def num_cores(self):
+        return max(self.cores) + 1 if self.cores else 1
+
+    def by_core(self):
+        # One timeline per core, sharing this one's pid table, each in the
+        # same start order.
+        if self.num_cores == 1:
+            return [self[:]]
+        lanes = [Timeline._from_arrays(self.pids, array("i"), array("q"), array("q"), array("h"))
+                 for _ in range(self.num_cores)]
+        for index, start, end, core in zip(self.pid_index, self.starts, self.ends, self.cores):
+            lane = lanes[core]
+            lane.pid_index.append(index)
+            lane.starts.append(start)
+            lane.ends.append(end)
+            lane.cores.append(core)
+        return lanes
+
+    def first_difference(self, other):
+        # Index of the first segment that differs, or None if the two
+        # timelines are identical.
+        if (self.pids == other.pids and self.pid_index == other.pid_index and self.starts == other.starts
+                and self.ends == other.ends and self.cores == other.cores):
+            return None
+        for i, (a, b) in enumerate(zip(self.segments(), other.segments())):
+            if a != b:
+                return i
+        return min(len(self), len(other)) if len(self) != len(other) else None
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(TIMELINE_HEADER.pack(TIMELINE_MAGIC, len(self.pids), len(self)))
+            for pid in self.pids:
+                encoded = str(pid).encode("utf-8")
+                f.write(PID_LENGTH.pack(len(encoded)))
+                f.write(encoded)
+            # Starts are stored as deltas from the previous start and ends as
+            # durations; both are small, so most columns pack into 1-2 bytes.
+            deltas = array("q", self.starts[:1])
+            deltas.extend(map(sub, self.starts[1:], self.starts))
+            for column in (self.pid_index, deltas, array("q", map(sub, self.ends, self.starts)), self.cores):
+                _write_column(f, column)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            magic, pid_count, count = TIMELINE_HEADER.unpack(f.read(TIMELINE_HEADER.size))
+            if magic not in (TIMELINE_MAGIC, TIMELINE_MAGIC_V1):
+                raise ValueError(f"{path} is not a saved timeline")
+            pids = []
+            for _ in range(pid_count):
+                (length,) = PID_LENGTH.unpack(f.read(PID_LENGTH.size))
+                pids.append(f.read(length).decode("utf-8"))
+            pid_index = array("i", _read_column(f, count))
+            starts = array("q", accumulate(_read_column(f, count)))
+            ends = array("q", map(add, starts, _read_column(f, count)))
+            cores = array("h", _read_column(f, count)) if magic == TIMELINE_MAGIC else None
+        return cls._from_arrays(pids, pid_index, starts, ends, cores)
+
+def _write_column(f, column):
+    # Each column is written with the narrowest signed type that holds it.
+    bound = max(max(column), -min(column) - 1) if column else 0
+    typecode = next(code for code, limit in COLUMN_TYPES if bound < limit)
+    f.write(typecode.encode("ascii"))
+    _to_little_endian(array(typecode, column)).tofile(f)
+
+def _read_column(f, count):
+    column = array(f.read(1).decode("ascii"))
+    column.fromfile(f, count)
+    return _to_little_endian(column)
+
+def _to_little_endian(column):
+    # Saved timelines are little-endian whatever machine wrote them; the
+    # swap is its own inverse, so it is used for loading too.
+    if sys.byteorder == "little":
+        return column
+    swapped = column[:]
+    swapped.byteswap()
+    return swapped
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("usage: python timeline_store.py OLD NEW", file=sys.stderr)
+        return 2
+    old, new = Timeline.load(argv[0]), Timeline.load(argv[1])
+    i = old.first_difference(new)
+    if i is None:
+        print(f"identical ({len(old)} segments)")
+        return 0
+    print(f"first difference at segment {i} (pid, start, end, core):")
+    for path, timeline in ((argv[0], old), (argv[1], new)):
+        print(f"  {path}: {next(timeline[i:i + 1].segments(), '<end>')}")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
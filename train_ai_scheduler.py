@@ -0,0 +1,154 @@
+# train_ai_scheduler.py
+# Trains the decision tree behind ai_scheduler.AIScheduler. Random workloads
+# are run under every algorithm, and each algorithm's cost on a workload is
+# its average turnaround (throughput), average response (interactivity) and
+# worst wait (starvation), each relative to the best algorithm on that
+# workload, summed. The tree picks splits and leaf labels
+# that minimize the total cost of the algorithms it would choose, so a
+# near-tie between two algorithms matters less than a clear loss.
+#
+#   python train_ai_scheduler.py --samples 3000 --jobs 8
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from ai_scheduler import FEATURES, MODEL_PATH, MODEL_VERSION, heuristic_choice, predict, workload_features
+from cpu_scheduler_algorithms import calculate_extended_metrics, run_algorithm
+from process_table import ProcessTable
+
+# The labels of the shipped model; the aging variants are left out so that
+# retraining reproduces it. Add them here (and retrain) to let Intelligent
+# pick them.
+ALGORITHMS = ["FCFS", "SJF-NP", "SJF-P", "RR", "PR-NP", "PR-P", "MLFQ"]
+OBJECTIVE = ["avg_turn", "avg_response", "max_wait"]
+QUANTA = [1, 2, 3, 4, 5, 8, 10]
+
+def random_workload(rng):
+    n = int(10 ** rng.uniform(1, 2.7))
+    burst_mean = 10 ** rng.uniform(0, 1.5)
+    shape = rng.choice(["uniform", "exponential", "bimodal", "pareto"])
+    if shape == "uniform":
+        bursts = [rng.uniform(0, 2 * burst_mean) for _ in range(n)]
+    elif shape == "exponential":
+        bursts = [rng.expovariate(1 / burst_mean) for _ in range(n)]
+    elif shape == "bimodal":
+        bursts = [burst_mean * (4 if rng.random() < 0.2 else 0.25) for _ in range(n)]
+    else:
+        bursts = [burst_mean * 0.4 * rng.paretovariate(1.5) for _ in range(n)]
+    bursts = [max(1, round(b)) for b in bursts]
+
+    if rng.random() < 0.15:
+        arrivals = [0] * n
+    else:
+        rate = rng.uniform(0.3, 3.0) / burst_mean   # offered load / mean burst
+        t = 0.0
+        arrivals = []
+        for _ in range(n):
+            arrivals.append(int(t))
+            t += rng.expovariate(rate)
+
+    levels = rng.randint(2, 10)
+    mix = rng.choice(["constant", "uniform", "short-first", "long-first"])
+    if mix == "constant":
+        priorities = [1] * n
+    elif mix == "uniform":
+        priorities = [rng.randint(1, levels) for _ in range(n)]
+    else:
+        order = sorted(range(n), key=bursts.__getitem__, reverse=mix == "long-first")
+        priorities = [0] * n
+        for rank, i in enumerate(order):
+            noisy = rank + rng.gauss(0, n / 10)
+            priorities[i] = min(max(1 + int(levels * noisy / n), 1), levels)
+    return ProcessTable([f"P{i}" for i in range(n)], arrivals, bursts, priorities), rng.choice(QUANTA)
+
+def label(seed):
+    # (features, cost per algorithm) for one random workload.
+    table, quantum = random_workload(random.Random(seed))
+    scores = []
+    for algo in ALGORITHMS:
+        completed = run_algorithm(algo, table.copy(), quantum, cache=None)[0]
+        metrics = calculate_extended_metrics(completed)
+        scores.append([metrics[name] for name in OBJECTIVE])
+    best = [min(column) for column in zip(*scores)]
+    costs = [sum((value + 1) / (low + 1) for value, low in zip(row, best)) for row in scores]
+    return workload_features(table, quantum), costs
+
+def build_tree(samples, max_depth, min_leaf):
+    totals = [sum(column) for column in zip(*(costs for _, costs in samples))]
+    leaf_cost = min(totals)
+    leaf = ALGORITHMS[totals.index(leaf_cost)]
+    if max_depth == 0 or len(samples) < 2 * min_leaf:
+        return leaf
+    best_cost, split = leaf_cost - 1e-9, None
+    for feature in range(len(FEATURES)):
+        ordered = sorted(samples, key=lambda sample: sample[0][feature])
+        left = [0.0] * len(totals)
+        for i in range(len(ordered) - 1):
+            left = [a + b for a, b in zip(left, ordered[i][1])]
+            if i + 1 < min_leaf or len(ordered) - i - 1 < min_leaf:
+                continue
+            value, following = ordered[i][0][feature], ordered[i + 1][0][feature]
+            if value == following:
+                continue
+            cost = min(left) + min(t - l for t, l in zip(totals, left))
+            if cost < best_cost:
+                best_cost, split = cost, (feature, float(f"{(value + following) / 2:.6g}"))
+    if split is None:
+        return leaf
+    feature, threshold = split
+    left = build_tree([s for s in samples if s[0][feature] <= threshold], max_depth - 1, min_leaf)
+    right = build_tree([s for s in samples if s[0][feature] > threshold], max_depth - 1, min_leaf)
+    if left == right and isinstance(left, str):
+        return left
+    return [feature, threshold, left, right]
+
+def evaluate(choose, samples):
+    # Accuracy against the best algorithm, and mean extra cost over it.
+    hits = regret = 0.0
+    for features, costs in samples:
+        cost = costs[ALGORITHMS.index(choose(features))]
+        hits += cost == min(costs)
+        regret += cost - min(costs)
+    return {"accuracy": round(hits / len(samples), 4), "regret": round(regret / len(samples), 4)}
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Train the AIScheduler algorithm predictor on simulated workloads.")
+    parser.add_argument("-n", "--samples", type=int, default=3000, help="random workloads to simulate (default: 3000)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--max-depth", type=int, default=6, help="maximum tree depth (default: 6)")
+    parser.add_argument("--min-leaf", type=int, default=20, help="fewest workloads per leaf (default: 20)")
+    parser.add_argument("--holdout", type=float, default=0.2, help="fraction kept back for evaluation (default: 0.2)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output", default=MODEL_PATH, help=f"model file (default: {MODEL_PATH})")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    seeds = [args.seed * 1_000_003 + i for i in range(args.samples)]
+    if args.jobs == 1:
+        samples = list(map(label, seeds))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+            samples = list(executor.map(label, seeds, chunksize=16))
+    cut = int(len(samples) * (1 - args.holdout))
+    train, test = samples[:cut], samples[cut:] or samples[:cut]
+    tree = build_tree(train, args.max_depth, args.min_leaf)
+
+    quality = {"model": evaluate(lambda f: predict(tree, f), test), "heuristic": evaluate(heuristic_choice, test)}
+    for algo in ALGORITHMS:
+        quality[f"always {algo}"] = evaluate(lambda f: algo, test)
+    for name, result in quality.items():
+        print(f"{name:>16}: accuracy {result['accuracy']:.1%}, mean regret {result['regret']:.4f}", file=sys.stderr)
+
+    model = {"version": MODEL_VERSION, "features": FEATURES, "algorithms": ALGORITHMS, "objective": OBJECTIVE,
+             "samples": args.samples, "seed": args.seed, "quality": quality, "tree": tree}
+    with open(args.output, "w") as f:
+        json.dump(model, f, indent=1)
+        f.write("\n")
+    print(f"Model written to {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+# virtual_table.py
+# A Treeview that only ever holds the rows on screen. The data stays in the
+# caller's own structure (a ProcessTable, a list of processes, ...) behind a
+# TableModel, which sorts and filters by keeping a list of row indices
+# rather than reordering or copying the data. Scrolling rewrites the values
+# of the few visible items, so showing, appending to or re-sorting a
+# million-row table costs about the same as a ten-row one on the Tk side.
+import operator
+import re
+import tkinter as tk
+from bisect import insort
+from tkinter import ttk
+
+FILTER_PATTERN = re.compile(r"^\s*([\w ]+?)\s*(<=|>=|!=|==|=|<|>)\s*(-?\d+(?:\.\d+)?)\s*$")
+FILTER_OPS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+              "=": operator.eq, "==": operator.eq, "!=": operator.ne}
+
+def _sort_key(value):
+    # Missing values (None) sort last; numbers before text.
+    if value is None:
+        return (2, 0)
+    if isinstance(value, str):
+        return (1, value)
+    return (0, value)
+
+def parse_filter(text, columns):
+    # "burst > 5" or "Avg Wait<=3" compares a column with a number; any
+    # other text matches rows whose first column contains it.
+    text = text.strip()
+    if not text:
+        return None
+    match = FILTER_PATTERN.match(text)
+    names = [name.lower().replace(" ", "") for name in columns]
+    if match and match.group(1).lower().replace(" ", "") in names:
+        column = names.index(match.group(1).lower().replace(" ", ""))
+        compare, number = FILTER_OPS[match.group(2)], float(match.group(3))
+        return lambda row: isinstance(row[column], (int, float)) and compare(row[column], number)
+    needle = text.lower()
+    return lambda row: needle in str(row[0]).lower()
+
+class TableModel:
+    # size() is the number of rows and row(i) the raw values of row i. The
+    # view order is None (every row, in data order) until the table is
+    # sorted or filtered; then it is the visible row indices, ascending by
+    # the sort column, and descending sorts are read back to front.
+    def __init__(self, columns, size, row, display=None):
+        self.columns = list(columns)
+        self.size = size
+        self.row = row
+        self.display = display or (lambda values: tuple("N/A" if v is None else v for v in values))
+        self.sort_column = None
+        self.descending = False
+        self.predicate = None
+        self.order = None
+
+    def __len__(self):
+        return self.size() if self.order is None else len(self.order)
+
+    def index(self, position):
+        if self.order is None:
+            return position
+        return self.order[len(self.order) - 1 - position] if self.descending else self.order[position]
+
+    def values(self, position):
+        return self.display(self.row(self.index(position)))
+
+    def _key(self):
+        column, row = self.sort_column, self.row
+        return lambda i: _sort_key(row(i)[column])
+
+    def refresh(self):
+        if self.sort_column is None and self.predicate is None:
+            self.order = None
+            return
+        indices = range(self.size())
+        if self.predicate is not None:
+            predicate, row = self.predicate, self.row
+            indices = [i for i in indices if predicate(row(i))]
+        self.order = sorted(indices, key=self._key()) if self.sort_column is not None else list(indices)
+
+    def sort(self, column):
+        # Clicking the same column again flips the direction.
+        if self.sort_column == column:
+            self.descending = not self.descending
+        else:
+            self.sort_column, self.descending = column, False
+        self.refresh()
+
+    def set_filter(self, predicate):
+        self.predicate = predicate
+        self.refresh()
+
+    def row_added(self, i):
+        # Row i was appended to the data; place it without a full refresh.
+        if self.order is None:
+            return
+        if self.predicate is not None and not self.predicate(self.row(i)):
+            return
+        if self.sort_column is None:
+            self.order.append(i)
+        else:
+            insort(self.order, i, key=self._key())
+
+class VirtualTable(ttk.Frame):
+    def __init__(self, parent, model, height=10, width=120, filter_box=True, style="Treeview"):
+        super().__init__(parent)
+        self.model = model
+        self.rows = height
+        self.first = 0
+        self.items = []
+        self.filter_id = None
+        self.filter_var = tk.StringVar()
+        if filter_box:
+            filter_frame = ttk.Frame(self)
+            filter_frame.pack(fill="x", pady=2)
+            ttk.Label(filter_frame, text="Filter:", style="Modern.TLabel").pack(side="left", padx=5)
+            ttk.Entry(filter_frame, textvariable=self.filter_var, width=30, style="TEntry").pack(side="left", padx=5)
+            self.count_label = ttk.Label(filter_frame, text="", style="Modern.TLabel")
+            self.count_label.pack(side="left", padx=5)
+            self.filter_var.trace_add("write", lambda *args: self.schedule_filter())
+
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(body, columns=model.columns, show="headings", height=height, style=style)
+        for i, col in enumerate(model.columns):
+            self.tree.heading(col, text=col, command=lambda c=i: self.sort(c))
+            self.tree.column(col, width=width, anchor="center")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.on_scroll, style="Vertical.TScrollbar")
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_rows(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-1))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(1))
+        self.render()
+
+    def render(self):
+        count = len(self.model)
+        self.first = max(0, min(self.first, count - self.rows))
+        visible = min(self.rows, count - self.first)
+        while len(self.items) < visible:
+            self.items.append(self.tree.insert("", "end"))
+        while len(self.items) > visible:
+            self.tree.delete(self.items.pop())
+        for k, item in enumerate(self.items):
+            self.tree.item(item, values=self.model.values(self.first + k))
+        if count:
+            self.scrollbar.set(self.first / count, (self.first + visible) / count)
+        else:
+            self.scrollbar.set(0, 1)
+        if hasattr(self, "count_label"):
+            total = self.model.size()
+            self.count_label.config(text=f"{count:,} of {total:,} rows" if count != total else f"{total:,} rows")
+
+    def scroll_rows(self, rows):
+        self.first += rows
+        self.render()
+        return "break"
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.first = int(float(amount) * len(self.model))
+        elif unit == "pages":
+            self.first += int(amount) * self.rows
+        else:
+            self.first += int(amount)
+        self.render()
+
+    def sort(self, column):
+        self.model.sort(column)
+        for i, col in enumerate(self.model.columns):
+            arrow = (" ▼" if self.model.descending else " ▲") if i == self.model.sort_column else ""
+            self.tree.heading(col, text=col + arrow)
+        self.render()
+
+    def schedule_filter(self):
+        # Refiltering a big table takes a moment, so wait for a pause in typing.
+        if self.filter_id is not None:
+            self.after_cancel(self.filter_id)
+        self.filter_id = self.after(300, self.apply_filter)
+
+    def apply_filter(self):
+        self.filter_id = None
+        self.model.set_filter(parse_filter(self.filter_var.get(), self.model.columns))
+        self.first = 0
+        self.render()
+
+    def refresh(self):
+        # The data was replaced or changed in place.
+        self.model.refresh()
+        self.render()
+
+    def row_added(self, i, follow=False):
+        self.model.row_added(i)
+        if follow:
+            self.first = len(self.model)
+        self.render()
@@ -0,0 +1,176 @@
+# workload_io.py
+# Readers and writers for process traces. Every reader yields
+# (pid, arrival, burst, priority) records one at a time, so a trace can be
+# fed to the schedulers lazily instead of being loaded up front.
+#
+# Supported formats, chosen by file extension:
+#   .json           the GUI's "Save Config" list (parsed in one go)
+#   .jsonl/.ndjson  one {"pid", "arrival", "burst", "priority"} object per line
+#   .csv            header row pid,arrival,burst,priority
+#   .trace          fixed-size binary records, read through mmap
+import csv
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+from array import array
+from cpu_scheduler_algorithms import Process, RunningMetrics, iter_schedule
+from process_table import ProcessTable
+
+TRACE_MAGIC = b"CPUTRC01"
+TRACE_HEADER = struct.Struct("<8sQ")      # magic, record count
+TRACE_RECORD = struct.Struct("<16sqqq")   # pid (UTF-8, NUL padded), arrival, burst, priority
+FIELDS = ["pid", "arrival", "burst", "priority"]
+
+def _format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        return "json"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    if ext == ".trace":
+        return "trace"
+    raise ValueError(f"Unsupported trace format: {path} (expected .json, .jsonl, .ndjson, .csv or .trace)")
+
+def read_json(path):
+    with open(path, "r") as f:
+        config = json.load(f)
+    for proc in config:
+        yield proc["pid"], int(proc["arrival"]), int(proc["burst"]), int(proc["priority"])
+
+def read_jsonl(path):
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                proc = json.loads(line)
+                yield proc["pid"], int(proc["arrival"]), int(proc["burst"]), int(proc["priority"])
+
+def read_csv(path):
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            yield row["pid"], int(row["arrival"]), int(row["burst"]), int(row["priority"])
+
+def read_trace(path):
+    # The file is mapped rather than read, so the OS pages records in as the
+    # scheduler reaches them and memory use does not grow with the trace.
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < TRACE_HEADER.size:
+            raise ValueError(f"{path} is not a process trace")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, count = TRACE_HEADER.unpack_from(mm, 0)
+            if magic != TRACE_MAGIC:
+                raise ValueError(f"{path} is not a process trace")
+            if size < TRACE_HEADER.size + count * TRACE_RECORD.size:
+                raise ValueError(f"{path} is truncated: expected {count} records")
+            offset = TRACE_HEADER.size
+            for _ in range(count):
+                pid, arrival, burst, priority = TRACE_RECORD.unpack_from(mm, offset)
+                offset += TRACE_RECORD.size
+                yield pid.rstrip(b"\0").decode("utf-8"), arrival, burst, priority
+
+def read_records(path):
+    return {"json": read_json, "jsonl": read_jsonl, "csv": read_csv, "trace": read_trace}[_format(path)](path)
+
+def write_trace(path, records):
+    with open(path, "wb") as f:
+        f.write(TRACE_HEADER.pack(TRACE_MAGIC, 0))
+        count = 0
+        for pid, arrival, burst, priority in records:
+            encoded = str(pid).encode("utf-8")
+            if len(encoded) > 16:
+                raise ValueError(f"PID {pid!r} is longer than 16 bytes and cannot be stored in a trace")
+            f.write(TRACE_RECORD.pack(encoded, arrival, burst, priority))
+            count += 1
+        f.seek(0)
+        f.write(TRACE_HEADER.pack(TRACE_MAGIC, count))
+    return count
+
+def write_records(path, records):
+    fmt = _format(path)
+    if fmt == "trace":
+        return write_trace(path, records)
+    count = 0
+    with open(path, "w", newline="") as f:
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            for record in records:
+                writer.writerow(record)
+                count += 1
+        elif fmt == "jsonl":
+            for record in records:
+                f.write(json.dumps(dict(zip(FIELDS, record))) + "\n")
+                count += 1
+        else:
+            config = [dict(zip(FIELDS, record)) for record in records]
+            json.dump(config, f)
+            count = len(config)
+    return count
+
+def load_table(path):
+    pids = []
+    arrival, burst, priority = array("q"), array("q"), array("q")
+    for record in read_records(path):
+        pids.append(record[0])
+        arrival.append(record[1])
+        burst.append(record[2])
+        priority.append(record[3])
+    return ProcessTable(pids, arrival, burst, priority)
+
+def iter_processes(path):
+    for record in read_records(path):
+        yield Process(*record)
+
+def prefetch(iterable, depth=8, chunk_size=1024):
+    # Runs the producer on a background thread, handing items over in chunks
+    # through a bounded queue so that reading and parsing overlap with the
+    # simulation without unbounded read-ahead.
+    chunks = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def produce():
+        try:
+            chunk = []
+            for item in iterable:
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    chunks.put(chunk)
+                    chunk = []
+                    if stop.is_set():
+                        return
+            if chunk:
+                chunks.put(chunk)
+            chunks.put(done)
+        except BaseException as e:
+            chunks.put(e)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is done:
+                return
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield from chunk
+    finally:
+        stop.set()
+        while not chunks.empty():
+            chunks.get_nowait()
+
+def simulate_trace(path, algo, quantum, quanta=None, boost_interval=None):
+    # Constant memory: processes are created as the engine reaches them and
+    # dropped once they finish; only running totals are kept. The trace must
+    # be sorted by arrival time.
+    metrics = RunningMetrics()
+    for process, start, end, finished in iter_schedule(algo, prefetch(iter_processes(path)), quantum, quanta, boost_interval):
+        if finished:
+            metrics.add(process)
+    return metrics